@@ -16,6 +16,8 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+from sys import intern
+
 from taskcoachlib.patterns import Observer, ObservableComposite
 from taskcoachlib.domain.categorizable import CategorizableCompositeObject
 from taskcoachlib.domain.base import NoteOwner, AttachmentOwner
@@ -250,7 +252,7 @@ class ChangeMonitor(Observer):
                     if '__del' + name in self._changes[obj.id()]:
                         self._changes[obj.id()].remove('__del' + name)
                     else:
-                        self._changes[obj.id()].add('__add' + name)
+                        self._changes[obj.id()].add(intern('__add' + name))
 
     def onCategoryRemoved(self, event):
         if self.__frozen:
@@ -263,7 +265,7 @@ class ChangeMonitor(Observer):
                     if '__add' + name in self._changes[obj.id()]:
                         self._changes[obj.id()].remove('__add' + name)
                     else:
-                        self._changes[obj.id()].add('__del' + name)
+                        self._changes[obj.id()].add(intern('__del' + name))
 
     def onPrerequisitesChanged(self, newValue, sender):  # pylint: disable-msg=W0613
         # Need to check whether the sender is actually in one of the collections we monitor
@@ -298,7 +300,10 @@ class ChangeMonitor(Observer):
 
     def addChange(self, obj, name):
         changes = self._changes.get(obj.id(), set())
-        changes.add(name)
+        # Interning keeps composed names (the category tags) sharing one
+        # string object per tag, so later membership tests compare by
+        # identity.
+        changes.add(intern(name))
         self._changes[obj.id()] = changes
 
     def resetAllChanges(self):
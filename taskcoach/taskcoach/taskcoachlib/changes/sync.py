@@ -17,6 +17,9 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 from builtins import object
+from collections import deque
+from sys import intern
+
 import wx  # For ArtProvider
 
 from taskcoachlib.changes import ChangeMonitor
@@ -30,24 +33,118 @@ from taskcoachlib.notify import AbstractNotifier
 from taskcoachlib.i18n import _
 
 
+# isinstance against these (partly ABC-style) classes is comparatively
+# slow and the synchronizer repeats the same checks for the same classes
+# on every pass, so the verdicts are cached per class as a small bitmask.
+_COMPOSITE = 1
+_NOTE_OWNER = 2
+_ATTACHMENT_OWNER = 4
+_TASK = 8
+
+_KIND_CACHE = {}
+
+# The owner add/remove method suffix ('Note', 'Attachment', ...) only
+# depends on the class, not the instance; cache it per type.
+_CLASSNAME_CACHE = {}
+
+
+def _className(cls):
+    name = _CLASSNAME_CACHE.get(cls)
+    if name is None:
+        name = cls.__name__
+        if name.endswith('Attachment'):
+            name = 'Attachment'
+        _CLASSNAME_CACHE[cls] = name
+    return name
+
+
+# Change-name sentinels. The literals below are identifier-like, so
+# CPython interns them anyway; naming them once keeps every site using
+# the same string object (identity fast path in the change sets) and
+# avoids typo-prone repetition.
+_DEL = intern('__del__')
+_PARENT = intern('__parent__')
+_PREREQUISITES = intern('__prerequisites__')
+_TASK_CHANGE = intern('__task__')
+_OWNER = intern('__owner__')
+_APPEARANCE = intern('appearance')
+_EXPANDED_CONTEXTS = intern('expandedContexts')
+
+
+def _kind(cls):
+    kind = _KIND_CACHE.get(cls)
+    if kind is None:
+        kind = ((_COMPOSITE if issubclass(cls, CompositeObject) else 0) |
+                (_NOTE_OWNER if issubclass(cls, NoteOwner) else 0) |
+                (_ATTACHMENT_OWNER if issubclass(cls, AttachmentOwner) else 0) |
+                (_TASK if issubclass(cls, Task) else 0))
+        _KIND_CACHE[cls] = kind
+    return kind
+
+
 class ChangeSynchronizer(object):
     def __init__(self, monitor, allChanges):
         self._monitor = monitor
         self._allChanges = allChanges
+        # Unbound-method caches, keyed by (type, name); they save the
+        # string formatting and getattr per object in the merge loops.
+        self._adderCache = {}
+        self._removerCache = {}
+        self._getterCache = {}
+        self._setterCache = {}
+
+    def _adder(self, owner, className):
+        key = (type(owner), className)
+        method = self._adderCache.get(key)
+        if method is None:
+            method = getattr(type(owner), 'add' + className)
+            self._adderCache[key] = method
+        return method
+
+    def _remover(self, owner, className):
+        key = (type(owner), className)
+        method = self._removerCache.get(key)
+        if method is None:
+            method = getattr(type(owner), 'remove' + className)
+            self._removerCache[key] = method
+        return method
+
+    def _getter(self, obj, getterName):
+        key = (type(obj), getterName)
+        method = self._getterCache.get(key)
+        if method is None:
+            method = getattr(type(obj), getterName)
+            self._getterCache[key] = method
+        return method
+
+    def _setter(self, obj, attrName):
+        key = (type(obj), attrName)
+        method = self._setterCache.get(key)
+        if method is None:
+            method = getattr(type(obj), 'set' + attrName[0].upper() + attrName[1:])
+            self._setterCache[key] = method
+        return method
 
     @staticmethod
     def allObjects(theList):
+        # Iterative traversal with an explicit deque; recursing per node
+        # costs a Python frame per level and is bounded by the recursion
+        # limit on deep ancestries.
+        stack = deque(theList)
         result = list()
-        for obj in theList:
-            result.append(obj)
-            if isinstance(obj, CompositeObject):
-                result.extend(ChangeSynchronizer.allObjects(obj.children()))
-            if isinstance(obj, NoteOwner):
-                result.extend(ChangeSynchronizer.allObjects(obj.notes()))
-            if isinstance(obj, AttachmentOwner):
-                result.extend(ChangeSynchronizer.allObjects(obj.attachments()))
-            if isinstance(obj, Task):
-                result.extend(obj.efforts())
+        append = result.append
+        while stack:
+            obj = stack.popleft()
+            append(obj)
+            kind = _kind(type(obj))
+            if kind & _COMPOSITE:
+                stack.extend(obj.children())
+            if kind & _NOTE_OWNER:
+                stack.extend(obj.notes())
+            if kind & _ATTACHMENT_OWNER:
+                stack.extend(obj.attachments())
+            if kind & _TASK:
+                stack.extend(obj.efforts())
         return result
 
     def sync(self, lists):
@@ -59,6 +156,7 @@ class ChangeSynchronizer(object):
         self.memOwnerMap = dict()
         self.diskMap = dict()
         self.diskOwnerMap = dict()
+        self.diskRoot = dict()
 
         # for devGUID, changes in self._allChanges.items():
         for devGUID, changes in list(self._allChanges.items()):
@@ -67,6 +165,13 @@ class ChangeSynchronizer(object):
                 break
         self._allChanges[self._monitor.guid()] = self._monitor
 
+        # Direct views on the monitors' id -> change-set dicts. The
+        # change containers are sets, so membership tests are O(1); going
+        # through the dicts saves a method call and a duplicate .id()
+        # hash per lookup in the passes below.
+        self.memChangeMap = self._monitor.allChanges()
+        self.diskChangeMap = self.diskChanges.allChanges()
+
         for memList, diskList in lists:
             self.mergeObjects(memList, diskList)
 
@@ -88,100 +193,167 @@ class ChangeSynchronizer(object):
 
     def mergeObjects(self, memList, diskList):
         # Map id to object
-        def addIds(objects, idMap, ownerMap, owner=None):
-            for obj in objects:
-                idMap[obj.id()] = obj
+        def addIds(objects, idMap, ownerMap):
+            stack = deque((obj, None) for obj in objects)
+            while stack:
+                obj, owner = stack.popleft()
+                # Interning the UUID strings makes all maps share one key
+                # object per id, so later probes compare by identity.
+                oid = intern(obj.id())
+                idMap[oid] = obj
                 if owner is not None:
-                    ownerMap[obj.id()] = owner
-                if isinstance(obj, CompositeObject):
-                    addIds(obj.children(), idMap, ownerMap)
-                if isinstance(obj, NoteOwner):
-                    addIds(obj.notes(), idMap, ownerMap, obj)
-                if isinstance(obj, AttachmentOwner):
-                    addIds(obj.attachments(), idMap, ownerMap, obj)
-                if isinstance(obj, Task):
-                    addIds(obj.efforts(), idMap, ownerMap)
+                    ownerMap[oid] = owner
+                kind = _kind(type(obj))
+                if kind & _COMPOSITE:
+                    stack.extend((child, None) for child in obj.children())
+                if kind & _NOTE_OWNER:
+                    stack.extend((note, obj) for note in obj.notes())
+                if kind & _ATTACHMENT_OWNER:
+                    stack.extend((attachment, obj) for attachment in obj.attachments())
+                if kind & _TASK:
+                    stack.extend((effort, None) for effort in obj.efforts())
 
         addIds(memList, self.memMap, self.memOwnerMap)
-        addIds(diskList, self.diskMap, self.diskOwnerMap)
 
-        self.mergeCompositeObjects(memList, diskList)
-        self.mergeOwnedObjectsFromDisk(diskList)
-        self.reparentObjects(memList, diskList)
-        self.deletedObjects(memList)
-        self.deletedOwnedObjects(memList)
+        # Fused disk-side pass: one parents-first walk both registers the
+        # disk ids and merges new composite and owned objects, instead of
+        # re-walking the graph for each concern. Objects with recorded
+        # disk changes are collected in diskDirty (in parents-first
+        # order) so the reparent and apply passes below only touch those
+        # instead of rescanning the whole tree. memList is sorted after
+        # the merge/reparent passes so that the deletion passes see the
+        # newly added objects too.
+        self.diskDirty = []
+        self.mergeFromDisk(memList, diskList)
+
+        self.reparentObjects(memList)
+        memSorted = memList.allItemsSorted()
+        self.deletedObjects(memList, memSorted)
+        self.deletedOwnedObjects(memSorted)
         self.applyChanges(memList)
 
-    def mergeCompositeObjects(self, memList, diskList):
-        # First pass: new composite objects on disk. Don't handle
-        # other (notes belonging to object, attachments, efforts) yet
-        # because they may belong to a category. This assumes that
-        # categories are the first domain class handled.
-
-        for diskObject in diskList.allItemsSorted():
-            memChanges = self._monitor.getChanges(diskObject)
-            deleted = memChanges is not None and '__del__' in memChanges
-            diskChanges = self.diskChanges.getChanges(diskObject)
-            if deleted and diskChanges is not None and '__del__' not in diskChanges and len(diskChanges) > 0:
-                # "undelete" it
-                memChanges.remove('__del__')
-                deleted = False
-
-            if diskObject.id() not in self.memMap and not deleted:
-                if isinstance(diskObject, CompositeObject):
-                    # New children will be handled later. This assumes
-                    # that the parent() is not changed when removing a
-                    # child.
-                    for child in diskObject.children():
-                        diskObject.removeChild(child)
-                    parent = diskObject.parent()
-                    if parent is not None and parent.id() in self.memMap:
-                        parent = self.memMap[parent.id()]
-                        parent.addChild(diskObject)
-                        diskObject.setParent(parent)
-                    elif parent is not None:
-                        # Parent deleted from memory; the task will be
-                        # top-level.
-                        diskObject.setParent(None)
-                        self.conflictChanges.addChange(diskObject, '__parent__')
-                        self.notify(_('"%s" became top-level because its parent was locally deleted.') %
-                                    diskObject.subject())
-                memList.append(diskObject)
-                self.memMap[diskObject.id()] = diskObject
+    def mergeFromDisk(self, memList, diskList):
+        # New objects on disk, composite and owned (notes and attachments
+        # currently) alike, plus efforts. Merging an object only needs its
+        # parent and owner to be merged already, which the parents-first
+        # iteration guarantees; categories are assumed to be the first
+        # domain class handled (in a previous mergeObjects call).
 
-    def mergeOwnedObjectsFromDisk(self, diskList):
-        # Second pass: 'owned' objects (notes and attachments
-        # currently) new on disk, and efforts.
+        # Local bindings for the loop; attribute lookups through self are
+        # two dict probes per access in CPython.
+        diskMap = self.diskMap
+        diskChangeMap = self.diskChangeMap
+        dirtyAppend = self.diskDirty.append
 
-        for obj in diskList.allItemsSorted():
-            if isinstance(obj, NoteOwner):
-                self._handleNewOwnedObjectsOnDisk(obj.notes())
-            if isinstance(obj, AttachmentOwner):
-                self._handleNewOwnedObjectsOnDisk(obj.attachments())
-            if isinstance(obj, Task):
-                self._handleNewEffortsOnDisk(obj.efforts())
+        for diskObject in diskList.allItemsSorted():
+            oid = intern(diskObject.id())
+            diskMap[oid] = diskObject
+            if oid in diskChangeMap:
+                dirtyAppend(diskObject)
+            self._registerOwnedObjects(diskObject)
+            self._mergeCompositeObject(memList, diskObject)
+            kind = _kind(type(diskObject))
+            if kind & _NOTE_OWNER:
+                self._handleNewOwnedObjectsOnDisk(diskObject.notes())
+            if kind & _ATTACHMENT_OWNER:
+                self._handleNewOwnedObjectsOnDisk(diskObject.attachments())
+            if kind & _TASK:
+                self._handleNewEffortsOnDisk(diskObject.efforts())
+
+    def _registerOwnedObjects(self, owner):
+        # Record the ids of everything the object owns, tracking owners
+        # the same way addIds does for the memory side. Each owned
+        # object's top-level ancestor (the object that carries the
+        # diskOwnerMap entry) is recorded too, so later passes can find
+        # it with a dict probe instead of walking the parent chain.
+        stack = deque()
+
+        def pushOwned(obj, kind):
+            if kind & _NOTE_OWNER:
+                stack.extend((note, obj, note) for note in obj.notes())
+            if kind & _ATTACHMENT_OWNER:
+                stack.extend((attachment, obj, attachment)
+                             for attachment in obj.attachments())
+            if kind & _TASK:
+                stack.extend((effort, None, None) for effort in obj.efforts())
+
+        diskMap = self.diskMap
+        diskChangeMap = self.diskChangeMap
+        dirtyAppend = self.diskDirty.append
+        diskOwnerMap = self.diskOwnerMap
+        diskRoot = self.diskRoot
+
+        pushOwned(owner, _kind(type(owner)))
+        while stack:
+            obj, objOwner, root = stack.popleft()
+            oid = intern(obj.id())
+            diskMap[oid] = obj
+            if oid in diskChangeMap:
+                dirtyAppend(obj)
+            if objOwner is not None:
+                diskOwnerMap[oid] = objOwner
+            if root is not None:
+                diskRoot[oid] = root
+            kind = _kind(type(obj))
+            if kind & _COMPOSITE:
+                stack.extend((child, None, root) for child in obj.children())
+            pushOwned(obj, kind)
+
+    def _mergeCompositeObject(self, memList, diskObject):
+        memChanges = self.memChangeMap.get(diskObject.id())
+        deleted = memChanges is not None and _DEL in memChanges
+        diskChanges = self.diskChangeMap.get(diskObject.id())
+        if deleted and diskChanges is not None and _DEL not in diskChanges and len(diskChanges) > 0:
+            # "undelete" it
+            memChanges.remove(_DEL)
+            deleted = False
+
+        if diskObject.id() not in self.memMap and not deleted:
+            if _kind(type(diskObject)) & _COMPOSITE:
+                # New children will be handled later. This assumes
+                # that the parent() is not changed when removing a
+                # child.
+                for child in diskObject.children():
+                    diskObject.removeChild(child)
+                parent = diskObject.parent()
+                if parent is not None and parent.id() in self.memMap:
+                    parent = self.memMap[parent.id()]
+                    parent.addChild(diskObject)
+                    diskObject.setParent(parent)
+                elif parent is not None:
+                    # Parent deleted from memory; the task will be
+                    # top-level.
+                    diskObject.setParent(None)
+                    self.conflictChanges.addChange(diskObject, _PARENT)
+                    self.notify(_('"%s" became top-level because its parent was locally deleted.') %
+                                diskObject.subject())
+            memList.append(diskObject)
+            self.memMap[intern(diskObject.id())] = diskObject
 
     def _handleNewOwnedObjectsOnDisk(self, diskObjects):
-        for diskObject in diskObjects:
-            className = diskObject.__class__.__name__
-            if className.endswith('Attachment'):
-                className = 'Attachment'
+        memMap = self.memMap
+        memChangesGet = self.memChangeMap.get
+        diskOwnerMap = self.diskOwnerMap
 
-            if isinstance(diskObject, CompositeObject):
+        for diskObject in diskObjects:
+            className = _className(type(diskObject))
+            kind = _kind(type(diskObject))
+            if kind & _COMPOSITE:
                 children = diskObject.children()[:]
 
-            memChanges = self._monitor.getChanges(diskObject)
-            deleted = memChanges is not None and '__del__' in memChanges
+            memChanges = memChangesGet(diskObject.id())
+            deleted = memChanges is not None and _DEL in memChanges
+            oid = intern(diskObject.id())
 
-            if diskObject.id() not in self.memMap and not deleted:
+            if oid not in memMap and not deleted:
                 addObject = True
 
-                if isinstance(diskObject, CompositeObject):
+                if kind & _COMPOSITE:
                     for child in diskObject.children():
                         diskObject.removeChild(child)
                     parent = diskObject.parent()
-                    if parent is not None and parent.id() in self.memMap:
-                        parent = self.memMap[parent.id()]
+                    if parent is not None and parent.id() in memMap:
+                        parent = memMap[parent.id()]
                         parent.addChild(diskObject)
                         diskObject.setParent(parent)
                     elif parent is not None:
@@ -189,287 +361,388 @@ class ChangeSynchronizer(object):
                         # becomes top-level but its owner stays
                         # the same.
                         diskObject.setParent(None)
-                        while parent.parent() is not None:
-                            parent = parent.parent()
-                        diskOwner = self.diskOwnerMap[parent.id()]
-                        if diskOwner.id() in self.memMap:
-                            memOwner = self.memMap[diskOwner.id()]
-                            getattr(memOwner, 'add%s' % className)(diskObject)
-                            self.conflictChanges.addChange(diskObject, '__owner__')
-                            self.memOwnerMap[diskObject.id()] = memOwner
+                        root = self.diskRoot[oid]
+                        diskOwner = diskOwnerMap[root.id()]
+                        if diskOwner.id() in memMap:
+                            memOwner = memMap[diskOwner.id()]
+                            self._adder(memOwner, className)(memOwner, diskObject)
+                            self.conflictChanges.addChange(diskObject, _OWNER)
+                            self.memOwnerMap[oid] = memOwner
                         self.notify(_('"%s" became top-level because its parent was locally deleted.') %
                                     diskObject.subject())
                     else:
-                        diskOwner = self.diskOwnerMap[diskObject.id()]
-                        if diskOwner.id() in self.memMap:
-                            memOwner = self.memMap[diskOwner.id()]
-                            getattr(memOwner, 'add%s' % className)(diskObject)
-                            self.memOwnerMap[diskObject.id()] = memOwner
+                        diskOwner = diskOwnerMap[oid]
+                        if diskOwner.id() in memMap:
+                            memOwner = memMap[diskOwner.id()]
+                            self._adder(memOwner, className)(memOwner, diskObject)
+                            self.memOwnerMap[oid] = memOwner
                         else:
                             # Owner deleted. Just forget it.
-                            self.conflictChanges.addChange(diskObject, '__del__')
+                            self.conflictChanges.addChange(diskObject, _DEL)
                             addObject = False
                 else:
-                    diskOwner = self.diskOwnerMap[diskObject.id()]
-                    if diskOwner.id() in self.memMap:
-                        memOwner = self.memMap[diskOwner.id()]
-                        getattr(memOwner, 'add%s' % className)(diskObject)
-                        self.memOwnerMap[diskObject.id()] = memOwner
+                    diskOwner = diskOwnerMap[oid]
+                    if diskOwner.id() in memMap:
+                        memOwner = memMap[diskOwner.id()]
+                        self._adder(memOwner, className)(memOwner, diskObject)
+                        self.memOwnerMap[oid] = memOwner
                     else:
                         # Forget it again...
-                        self.conflictChanges.addChange(diskObject, '__del__')
+                        self.conflictChanges.addChange(diskObject, _DEL)
                         addObject = False
 
                 if addObject:
-                    self.memMap[diskObject.id()] = diskObject
+                    memMap[oid] = diskObject
 
-            if diskObject.id() in self.memMap:
-                if isinstance(diskObject, CompositeObject):
+            if oid in memMap:
+                if kind & _COMPOSITE:
                     self._handleNewOwnedObjectsOnDisk(children)
-                if isinstance(diskObject, NoteOwner):
+                if kind & _NOTE_OWNER:
                     self._handleNewOwnedObjectsOnDisk(diskObject.notes())
-                if isinstance(diskObject, AttachmentOwner):
+                if kind & _ATTACHMENT_OWNER:
                     self._handleNewOwnedObjectsOnDisk(diskObject.attachments())
 
     def _handleNewEffortsOnDisk(self, diskEfforts):
+        memMap = self.memMap
+        memChangesGet = self.memChangeMap.get
         for diskEffort in diskEfforts:
-            memChanges = self._monitor.getChanges(diskEffort)
-            deleted = memChanges is not None and '__del__' in memChanges
-            if diskEffort.id() not in self.memMap and not deleted:
+            memChanges = memChangesGet(diskEffort.id())
+            deleted = memChanges is not None and _DEL in memChanges
+            oid = intern(diskEffort.id())
+            if oid not in memMap and not deleted:
                 diskTask = diskEffort.parent()
-                if diskTask.id() in self.memMap:
-                    memTask = self.memMap[diskTask.id()]
+                if diskTask.id() in memMap:
+                    memTask = memMap[diskTask.id()]
                     diskEffort.setTask(memTask)
-                    self.memMap[diskEffort.id()] = diskEffort
+                    memMap[oid] = diskEffort
                 else:
                     # Task deleted; forget it.
-                    self.conflictChanges.addChange(diskEffort, '__del__')
-
-    def reparentObjects(self, memList, diskList):
-        # Third pass: objects reparented on disk.
-
-        for diskObject in self.allObjects(diskList):
-            diskChanges = self.diskChanges.getChanges(diskObject)
-            if diskChanges is not None and '__parent__' in diskChanges:
-                memChanges = self._monitor.getChanges(diskObject)
-                memObject = self.memMap[diskObject.id()]
-                memList.remove(memObject)
-
-                # Note: no conflict resolution for this one,
-                # it would be a bit tricky... Instead, the
-                # disk version wins.
-
-                def sameParents(a, b):
-                    if a is None and b is None:
-                        return True
-                    elif a is None or b is None:
-                        return False
-                    return a.id() == b.id()
-
-                parentConflict = False
-                if memChanges is not None and '__parent__' in memChanges:
-                    if not sameParents(memObject.parent(), diskObject.parent()):
-                        parentConflict = True
-
-                if memObject.parent() is not None:
-                    memObject.parent().removeChild(memObject)
-
-                if parentConflict:
-                    diskParent = diskObject.parent()
-
-                    if diskParent is None:
-                        memObject.setParent(None)
-                    else:
-                        if diskParent.id() in self.memMap:
-                            memParent = self.memMap[diskParent.id()]
-                            memParent.addChild(memObject)
-                            memObject.setParent(memParent)
-                        else:
-                            # New parent deleted from memory...
-                            memObject.setParent(None)
-                            self.conflictChanges.addChange(memObject, '__parent__')
+                    self.conflictChanges.addChange(diskEffort, _DEL)
+
+    def reparentObjects(self, memList):
+        # Third pass: objects reparented on disk. Only the dirty objects
+        # need to be looked at; typically a handful out of thousands.
+
+        def sameParents(a, b):
+            if a is None and b is None:
+                return True
+            elif a is None or b is None:
+                return False
+            return a.id() == b.id()
+
+        reparented = []
+        for diskObject in self.diskDirty:
+            diskChanges = self.diskChangeMap.get(diskObject.id())
+            if diskChanges is not None and _PARENT in diskChanges:
+                reparented.append((self.memMap[diskObject.id()], diskObject))
+        if not reparented:
+            return
+
+        # Remove all reparented objects in one batch, fix the parent
+        # pointers, then re-add them in one batch; this fires one
+        # compound notification per phase instead of one per object and
+        # avoids the O(n) list removal per object.
+        memList.removeItems([memObject for memObject, diskObject in reparented])
+
+        for memObject, diskObject in reparented:
+            memChanges = self.memChangeMap.get(diskObject.id())
+
+            # Note: no conflict resolution for this one,
+            # it would be a bit tricky... Instead, the
+            # disk version wins.
+
+            parentConflict = False
+            if memChanges is not None and _PARENT in memChanges:
+                if not sameParents(memObject.parent(), diskObject.parent()):
+                    parentConflict = True
+
+            if memObject.parent() is not None:
+                memObject.parent().removeChild(memObject)
+
+            if parentConflict:
+                diskParent = diskObject.parent()
+
+                if diskParent is None:
+                    memObject.setParent(None)
                 else:
-                    diskParent = diskObject.parent()
-                    if diskParent is None:
+                    if diskParent.id() in self.memMap:
+                        memParent = self.memMap[diskParent.id()]
+                        memParent.addChild(memObject)
+                        memObject.setParent(memParent)
+                    else:
+                        # New parent deleted from memory...
                         memObject.setParent(None)
+                        self.conflictChanges.addChange(memObject, _PARENT)
+            else:
+                diskParent = diskObject.parent()
+                if diskParent is None:
+                    memObject.setParent(None)
+                else:
+                    if diskParent.id() in self.memMap:
+                        memParent = self.memMap[diskParent.id()]
+                        memParent.addChild(memObject)
+                        memObject.setParent(memParent)
                     else:
-                        if diskParent.id() in self.memMap:
-                            memParent = self.memMap[diskParent.id()]
-                            memParent.addChild(memObject)
-                            memObject.setParent(memParent)
-                        else:
-                            memObject.setParent(None)
-                            self.conflictChanges.addChange(memObject, '__parent__')
+                        memObject.setParent(None)
+                        self.conflictChanges.addChange(memObject, _PARENT)
 
-                memList.append(memObject)
+        memList.extend([memObject for memObject, diskObject in reparented])
 
-    def deletedObjects(self, memList):
+    def deletedObjects(self, memList, memSorted):
         # Fourth pass: objects deleted from disk
 
-        for memObject in memList.allItemsSorted():
-            diskChanges = self.diskChanges.getChanges(memObject)
-            memChanges = self._monitor.getChanges(memObject)
-
-            if diskChanges is not None and '__del__' in diskChanges:
-                # if (memChanges is None or '__del__' in memChanges or len(memChanges) == 0):
-                if memChanges is None or '__del__' in memChanges or len(memChanges) == 0:
-                    memList.remove(memObject)
-                    del self.memMap[memObject.id()]
-                    if memObject.id() in self.memOwnerMap:
-                        del self.memOwnerMap[memObject.id()]
+        toRemove = []
+        diskChangesGet = self.diskChangeMap.get
+        memChangesGet = self.memChangeMap.get
+        for memObject in memSorted:
+            oid = memObject.id()
+            diskChanges = diskChangesGet(oid)
+            memChanges = memChangesGet(oid)
+
+            if diskChanges is not None and _DEL in diskChanges:
+                oid = intern(oid)
+                # if (memChanges is None or _DEL in memChanges or len(memChanges) == 0):
+                if memChanges is None or _DEL in memChanges or len(memChanges) == 0:
+                    toRemove.append(memObject)
+                    del self.memMap[oid]
+                    self.memOwnerMap.pop(oid, None)
                 else:
                     # If there are local changes they win over deletion.
-                    self.diskMap[memObject.id()] = memObject
+                    self.diskMap[oid] = memObject
                     self.diskChanges.resetChanges(memObject)
-
-    def deletedOwnedObjects(self, memList):
-        for obj in memList.allItemsSorted():
-            if isinstance(obj, NoteOwner):
+        if toRemove:
+            # One bulk removal instead of one O(n) remove (and one
+            # notification) per object.
+            memList.removeItems(toRemove)
+
+    def deletedOwnedObjects(self, memSorted):
+        memMap = self.memMap
+        for obj in memSorted:
+            if obj.id() not in memMap:
+                # Removed by the previous pass.
+                continue
+            kind = _kind(type(obj))
+            if kind & _NOTE_OWNER:
                 self._handleOwnedObjectsRemovedFromDisk(obj.notes())
-            if isinstance(obj, AttachmentOwner):
+            if kind & _ATTACHMENT_OWNER:
                 self._handleOwnedObjectsRemovedFromDisk(obj.attachments())
-            if isinstance(obj, Task):
+            if kind & _TASK:
                 self._handleEffortsRemovedFromDisk(obj.efforts())
 
     def _handleOwnedObjectsRemovedFromDisk(self, memObjects):
-        for memObject in memObjects:
-            className = memObject.__class__.__name__
-            if className.endswith('Attachment'):
-                className = 'Attachment'
-
-            if isinstance(memObject, CompositeObject):
-                self._handleOwnedObjectsRemovedFromDisk(memObject.children())
-            if isinstance(memObject, NoteOwner):
-                self._handleOwnedObjectsRemovedFromDisk(memObject.notes())
-            if isinstance(memObject, AttachmentOwner):
-                self._handleOwnedObjectsRemovedFromDisk(memObject.attachments())
-
-            diskChanges = self.diskChanges.getChanges(memObject)
-            if diskChanges is not None and '__del__' in diskChanges:
+        # Iterative post-order traversal: descendants are handled before
+        # the objects owning them, as the recursive version did, but
+        # without a Python frame per level. A node is pushed with kind
+        # None first; when it is popped again with its kind filled in,
+        # its owned objects have already been handled.
+        memMap = self.memMap
+        memOwnerMap = self.memOwnerMap
+        diskChangesGet = self.diskChangeMap.get
+        stack = [(memObject, None) for memObject in reversed(list(memObjects))]
+        while stack:
+            memObject, kind = stack.pop()
+            if kind is None:
+                kind = _kind(type(memObject))
+                stack.append((memObject, kind))
+                owned = []
+                if kind & _COMPOSITE:
+                    owned.extend(memObject.children())
+                if kind & _NOTE_OWNER:
+                    owned.extend(memObject.notes())
+                if kind & _ATTACHMENT_OWNER:
+                    owned.extend(memObject.attachments())
+                stack.extend((obj, None) for obj in reversed(owned))
+                continue
+
+            className = _className(type(memObject))
+            oid = memObject.id()
+            diskChanges = diskChangesGet(oid)
+            if diskChanges is not None and _DEL in diskChanges:
                 # Same remark as above
-                if isinstance(memObject, CompositeObject):
+                if kind & _COMPOSITE:
                     if memObject.parent() is None:
-                        getattr(self.memOwnerMap[memObject.id()], 'remove%s' % className)(memObject)
+                        memOwner = memOwnerMap[oid]
+                        self._remover(memOwner, className)(memOwner, memObject)
                     else:
-                        self.memMap[memObject.parent().id()].removeChild(memObject)
+                        memMap[memObject.parent().id()].removeChild(memObject)
                 else:
-                    getattr(self.memOwnerMap[memObject.id()], 'remove%s' % className)(memObject)
-                del self.memMap[memObject.id()]
+                    memOwner = memOwnerMap[oid]
+                    self._remover(memOwner, className)(memOwner, memObject)
+                memMap.pop(oid, None)
 
     def _handleEffortsRemovedFromDisk(self, memEfforts):
         for memEffort in memEfforts:
-            diskChanges = self.diskChanges.getChanges(memEffort)
+            diskChanges = self.diskChangeMap.get(memEffort.id())
 
-            if diskChanges is not None and '__del__' in diskChanges:
+            if diskChanges is not None and _DEL in diskChanges:
                 # Same remark as above
                 self.memMap[memEffort.parent().id()].removeEffort(memEffort)
-                del self.memMap[memEffort.id()]
+                self.memMap.pop(memEffort.id(), None)
 
-    def applyChanges(self, memList):
-        # Final: apply disk changes
+    _APPEARANCE_ATTRS = ('foregroundColor', 'backgroundColor', 'font', 'icon',
+                         'selectedIcon')
 
-        for memObject in self.allObjects(memList.rootItems()):
-            diskChanges = self.diskChanges.getChanges(memObject)
+    def applyChanges(self, memList):
+        # Final: apply disk changes. Driven by the dirty set instead of a
+        # full walk of memList; objects whose changes were reset (local
+        # deletion won) or that were locally deleted are skipped here.
+
+        handlers = self._changeHandlers()
+        diskChangesGet = self.diskChangeMap.get
+        memChangesGet = self.memChangeMap.get
+        memMapGet = self.memMap.get
+        for diskObject in self.diskDirty:
+            oid = diskObject.id()
+            diskChanges = diskChangesGet(oid)
             if diskChanges:
-                memChanges = self._monitor.getChanges(memObject)
-                diskObject = self.diskMap[memObject.id()]
+                memObject = memMapGet(oid)
+                if memObject is None:
+                    continue
+                memChanges = memChangesGet(oid)
 
                 conflicts = []
 
                 for changeName in diskChanges:
-                    if changeName == '__parent__':
-                        pass  # Already handled
-                    elif changeName.startswith('__add_category:'):
-                        categoryId = changeName[15:]
-                        if categoryId not in self.memMap:
-                            # Mmmh, deleted...
-                            conflicts.append(changeName)
-                            self.conflictChanges.addChange(memObject, '__del' + changeName[5:])
-                        else:
-                            if memChanges is not None and \
-                                    '__del' + changeName[5:] in memChanges:
-                                conflicts.append(changeName)
-                                self.conflictChanges.addChange(memObject, '__del' + changeName[5:])
-                            else:
-                                # Aaaaah finally
-                                theCategory = self.memMap[categoryId]
-                                memObject.addCategory(theCategory)
-                                theCategory.addCategorizable(memObject)
+                    if changeName.startswith('__add_category:'):
+                        self._applyAddCategory(memObject, diskObject, memChanges,
+                                               changeName, conflicts)
                     elif changeName.startswith('__del_category:'):
-                        categoryId = changeName[15:]
-                        if categoryId in self.memMap:
-                            if memChanges is not None and \
-                                    '__add' + changeName[5:] in memChanges:
-                                conflicts.append(changeName)
-                                self.conflictChanges.addChange(memObject, '__add' + changeName[5:])
-                            else:
-                                theCategory = self.memMap[categoryId]
-                                memObject.removeCategory(theCategory)
-                                theCategory.removeCategorizable(memObject)
-                    elif changeName == '__prerequisites__':
-                        diskPrereqs = set([self.memMap[obj.id()] for obj in diskObject.prerequisites()])
-                        memPrereqs = set(memObject.prerequisites())
-                        if memChanges is not None and \
-                                '__prerequisites__' in memChanges and \
-                                memPrereqs != diskPrereqs:
-                            conflicts.append('__prerequisites__')
-                            self.conflictChanges.addChange(memObject, '__prerequisites__')
-                        else:
-                            memObject.setPrerequisites(diskPrereqs)
-                    elif changeName == '__task__':
-                        # Effort changed task
-                        if memChanges is not None and \
-                                '__task__' in memChanges and \
-                                memObject.parent().id() != diskObject.parent().id():
-                            conflicts.append('__task__')
-                            self.conflictChanges.addChange(memObject, '__task__')
-                        else:
-                            memObject.setTask(self.memMap[diskObject.parent().id()])
-                    elif changeName == '__owner__':
-                        # This happens after a conflict
-                        if memChanges is not None and \
-                                '__owner__' in memChanges and \
-                                self.memOwnerMap[memObject.id()].id() != self.diskOwnerMap[diskObject.id()].id():
-                            # Yet another conflict... Memory wins
-                            conflicts.append('__owner__')
-                            self.conflictChanges.addChange(memObject, '__owner__')
-                        else:
-                            className = memObject.__class__.__name__
-                            if className.endsWith('Attachment'):
-                                className = 'Attachment'
-                            oldOwner = self.memOwnerMap[memObject.id()]
-                            newOwner = self.memOwnerMap[diskObject.id()]
-                            getattr(oldOwner, 'remove%s' % className)(memObject)
-                            getattr(newOwner, 'add%s' % className)(memObject)
-                    elif changeName == 'appearance':
-                        attrNames = ['foregroundColor', 'backgroundColor', 'font', 'icon', 'selectedIcon']
-                        if memChanges is not None and \
-                                'appearance' in memChanges:
-                            for attrName in attrNames:
-                                if getattr(memObject, attrName)() != getattr(diskObject, attrName)():
-                                    conflicts.append(attrName)
-                            self.conflictChanges.addChange(memObject, 'appearance')
-                        else:
-                            for attrName in attrNames:
-                                getattr(memObject, 'set' + attrName[0].upper() + attrName[1:])(getattr(diskObject,
-                                                                                                       attrName)())
-                    elif changeName == 'expandedContexts':
-                        # Note: no conflict resolution for this one.
-                        memObject.expand(diskObject.isExpanded())
+                        self._applyDelCategory(memObject, diskObject, memChanges,
+                                               changeName, conflicts)
                     else:
-                        if changeName in ['start', 'stop']:
-                            getterName = 'get' + changeName[0].upper() + changeName[1:]
-                        else:
-                            getterName = changeName
-                        if memChanges is not None and \
-                                changeName in memChanges and \
-                                getattr(memObject, getterName)() != getattr(diskObject, getterName)():
-                            conflicts.append(changeName)
-                            self.conflictChanges.addChange(memObject, changeName)
-                        else:
-                            getattr(memObject, 'set' + changeName[0].upper() + changeName[1:])(
-                                getattr(diskObject, getterName)())
-
-                    if conflicts:
-                        self.notify(
-                            _('Conflicts detected for "%s".\nThe local version was used.') % memObject.subject())
+                        handler = handlers.get(changeName,
+                                               ChangeSynchronizer._applyScalar)
+                        if handler is not None:
+                            handler(self, memObject, diskObject, memChanges,
+                                    changeName, conflicts)
+
+                # Notify once per object, not once per change; the
+                # notification pops up a balloon and is by far the most
+                # expensive statement in this loop.
+                if conflicts:
+                    self.notify(
+                        _('Conflicts detected for "%s".\nThe local version was used.') % memObject.subject())
+
+    @classmethod
+    def _changeHandlers(cls):
+        # Dispatch table for applyChanges; None means "already handled in
+        # an earlier pass". Built lazily so the handlers below can be
+        # referenced as plain functions.
+        handlers = cls.__dict__.get('_changeHandlerTable')
+        if handlers is None:
+            handlers = {
+                _PARENT: None,  # Already handled
+                _PREREQUISITES: cls._applyPrerequisites,
+                _TASK_CHANGE: cls._applyTask,
+                _OWNER: cls._applyOwner,
+                _APPEARANCE: cls._applyAppearance,
+                _EXPANDED_CONTEXTS: cls._applyExpandedContexts,
+            }
+            cls._changeHandlerTable = handlers
+        return handlers
+
+    def _applyAddCategory(self, memObject, diskObject, memChanges, changeName,
+                          conflicts):
+        categoryId = changeName[15:]
+        if categoryId not in self.memMap:
+            # Mmmh, deleted...
+            conflicts.append(changeName)
+            self.conflictChanges.addChange(memObject, '__del' + changeName[5:])
+        else:
+            if memChanges is not None and \
+                    '__del' + changeName[5:] in memChanges:
+                conflicts.append(changeName)
+                self.conflictChanges.addChange(memObject, '__del' + changeName[5:])
+            else:
+                # Aaaaah finally
+                theCategory = self.memMap[categoryId]
+                memObject.addCategory(theCategory)
+                theCategory.addCategorizable(memObject)
+
+    def _applyDelCategory(self, memObject, diskObject, memChanges, changeName,
+                          conflicts):
+        categoryId = changeName[15:]
+        if categoryId in self.memMap:
+            if memChanges is not None and \
+                    '__add' + changeName[5:] in memChanges:
+                conflicts.append(changeName)
+                self.conflictChanges.addChange(memObject, '__add' + changeName[5:])
+            else:
+                theCategory = self.memMap[categoryId]
+                memObject.removeCategory(theCategory)
+                theCategory.removeCategorizable(memObject)
+
+    def _applyPrerequisites(self, memObject, diskObject, memChanges, changeName,
+                            conflicts):
+        memMap = self.memMap
+        diskPrereqs = {memMap[obj.id()] for obj in diskObject.prerequisites()}
+        memPrereqs = set(memObject.prerequisites())
+        if memChanges is not None and \
+                _PREREQUISITES in memChanges and \
+                memPrereqs != diskPrereqs:
+            conflicts.append(_PREREQUISITES)
+            self.conflictChanges.addChange(memObject, _PREREQUISITES)
+        else:
+            memObject.setPrerequisites(diskPrereqs)
+
+    def _applyTask(self, memObject, diskObject, memChanges, changeName,
+                   conflicts):
+        # Effort changed task
+        if memChanges is not None and \
+                _TASK_CHANGE in memChanges and \
+                memObject.parent().id() != diskObject.parent().id():
+            conflicts.append(_TASK_CHANGE)
+            self.conflictChanges.addChange(memObject, _TASK_CHANGE)
+        else:
+            memObject.setTask(self.memMap[diskObject.parent().id()])
+
+    def _applyOwner(self, memObject, diskObject, memChanges, changeName,
+                    conflicts):
+        # This happens after a conflict
+        if memChanges is not None and \
+                _OWNER in memChanges and \
+                self.memOwnerMap[memObject.id()].id() != self.diskOwnerMap[diskObject.id()].id():
+            # Yet another conflict... Memory wins
+            conflicts.append(_OWNER)
+            self.conflictChanges.addChange(memObject, _OWNER)
+        else:
+            className = _className(type(memObject))
+            oldOwner = self.memOwnerMap[memObject.id()]
+            newOwner = self.memOwnerMap[diskObject.id()]
+            self._remover(oldOwner, className)(oldOwner, memObject)
+            self._adder(newOwner, className)(newOwner, memObject)
+
+    def _applyAppearance(self, memObject, diskObject, memChanges, changeName,
+                         conflicts):
+        if memChanges is not None and \
+                _APPEARANCE in memChanges:
+            for attrName in self._APPEARANCE_ATTRS:
+                if self._getter(memObject, attrName)(memObject) != \
+                        self._getter(diskObject, attrName)(diskObject):
+                    conflicts.append(attrName)
+            self.conflictChanges.addChange(memObject, _APPEARANCE)
+        else:
+            for attrName in self._APPEARANCE_ATTRS:
+                self._setter(memObject, attrName)(
+                    memObject, self._getter(diskObject, attrName)(diskObject))
+
+    def _applyExpandedContexts(self, memObject, diskObject, memChanges,
+                               changeName, conflicts):
+        # Note: no conflict resolution for this one.
+        memObject.expand(diskObject.isExpanded())
+
+    def _applyScalar(self, memObject, diskObject, memChanges, changeName,
+                     conflicts):
+        if changeName in ('start', 'stop'):
+            getterName = 'get' + changeName[0].upper() + changeName[1:]
+        else:
+            getterName = changeName
+        if memChanges is not None and \
+                changeName in memChanges and \
+                self._getter(memObject, getterName)(memObject) != \
+                self._getter(diskObject, getterName)(diskObject):
+            conflicts.append(changeName)
+            self.conflictChanges.addChange(memObject, changeName)
+        else:
+            self._setter(memObject, changeName)(
+                memObject, self._getter(diskObject, getterName)(diskObject))
@@ -16,8 +16,29 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from taskcoachlib import meta
 import argparse
+
+# NB: taskcoachlib.meta is deliberately not imported at module level; it
+# pulls in a cascade of modules that importers of this one (tests,
+# subprocesses) do not need unless they actually build a parser. The
+# methods that need it import it lazily.
+
+# Cached language choices for the --language option; the set of
+# translations only changes between releases, so it is computed once per
+# process.
+_LANG_CHOICES = None
+
+
+def _languageChoices():
+    global _LANG_CHOICES
+    if _LANG_CHOICES is None:
+        from taskcoachlib import meta
+        # The set literal fuses filtering out None and adding the 'en'
+        # fallback into a single pass over meta.data.languages.
+        _LANG_CHOICES = tuple(sorted(
+            {lang for lang, enabled in meta.data.languages.values()
+             if lang is not None} | {'en'}))
+    return _LANG_CHOICES
 # Analyseur d'arguments, d'options, et de sous-commandes de ligne de commande
 
 # Pour analyser les options de ligne de commande
@@ -145,6 +166,7 @@ class ApplicationArgumentParser(ArgumentParser):
         #
         # self.add_argument('--version', action='version',
         #                  version='%s %s' % (meta.data.name, meta.data.version))
+        from taskcoachlib import meta
         self.add_argument('--version', action='version',
                           version=f'{meta.data.name} {meta.data.version}')
 
@@ -210,8 +232,7 @@ class ApplicationArgumentParser(ArgumentParser):
         #   utilise le language spécifié pour le GUI (exemple "en", "nl" ou "fr")
         #   parmi celles contenues dans meta.data (choix parmi des strings)
         return self.add_argument('-l', '--language', dest='language',
-                                 type=str, choices=sorted([lang for (lang, enabled) in
-                                                          meta.data.languages.values() if lang is not None] + ['en']),
+                                 type=str, choices=_languageChoices(),
                                  help='use the specified LANGUAGE for the GUI (e.g. "nl" or "fr")')
 
     def pooption(self):
@@ -17,7 +17,8 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 from builtins import str
-from io import open as file
+from functools import lru_cache
+from io import StringIO, open as file
 
 from taskcoachlib import meta, patterns, operating_system
 # try:
@@ -25,10 +26,10 @@ from taskcoachlib import meta, patterns, operating_system
 # except ImportError:
 from pubsub import pub
 # from wx.lib.pubsub import pub
+import ast
 import configparser
 import os
 import sys
-import wx
 import shutil
 from . import defaults
 
@@ -37,23 +38,10 @@ from taskcoachlib.i18n import _
 from taskcoachlib.workarounds import ExceptionAsUnicode  # Est-ce nécessaire ? pour python 2.7 ?
 
 
-# lignes 32 à 40 peut-être inutiles, ou à refaire complètement (les règles unicode ont changé)
-# class UnicodeAwareConfigParser(configparser.RawConfigParser):
-#    # https://docs.python.org/3.11/library/configparser.html#configparser.RawConfigParser
-#    def set(self, section, option, value):  # pylint: disable=W0222
-#        # Signature of method 'UnicodeAwareConfigParser.set()'
-#        # does not match signature of the base method in class 'RawConfigParser'
-#        # if type(value) == type(u''):  # utiliser isinstance à la place ?
-#        if isinstance(value, str):
-#            value = value.encode('utf-8')
-#        configparser.RawConfigParser.set(self, section, option, value)
-
-#    def get(self, section, setting):  # pylint: disable=W0221
-#        value = configparser.RawConfigParser.get(self, section, setting)
-#        return value.decode('utf-8')  # pylint: disable=E1103
-
-
-# class CachingConfigParser(UnicodeAwareConfigParser):
+# The Py2-era UnicodeAwareConfigParser used to sit between this class
+# and RawConfigParser purely to encode/decode utf-8; under Py3 that is a
+# no-op, and the extra Python-level frame per get/set is not free, so
+# the layer is gone.
 class CachingConfigParser(configparser.RawConfigParser):
     """ ConfigParser is rather slow, so cache its values.
 
@@ -63,14 +51,10 @@ class CachingConfigParser(configparser.RawConfigParser):
 
     def __init__(self, *args, **kwargs):
         self.__cachedValues = dict()
-        # UnicodeAwareConfigParser.__init__(self, *args, **kwargs)
-        # configparser.RawConfigParser.__init__(self, *args, **kwargs)
         super().__init__(*args, **kwargs)
 
     def read(self, *args, **kwargs):
         self.__cachedValues = dict()
-        # return UnicodeAwareConfigParser.read(self, *args, **kwargs)
-        # return configparser.RawConfigParser.read(self, *args, **kwargs)
         return super().read(*args, **kwargs)
 
     # def set(self, section, setting, value):
@@ -78,24 +62,220 @@ class CachingConfigParser(configparser.RawConfigParser):
     # does not match signature of the base method in class 'RawConfigParser'
     def set(self, section, setting, value=None):
         self.__cachedValues[(section, setting)] = value
-        # UnicodeAwareConfigParser.set(self, section, setting, value)
-        # configparser.RawConfigParser.set(self, section, setting, value)
         super().set(section, setting, value)
 
+    def _populateCache(self, section, values):
+        # Bulk variant of the cache fill in set(), for callers loading a
+        # whole section at once.
+        cache = self.__cachedValues
+        for setting, value in values.items():
+            cache[(section, setting)] = value
+
     # def get(self, section, setting):
     def get(self, section, setting, **kwargs):
         # Signature of method 'CachingConfigParser.get()'
         # does not match signature of the base method in class 'RawConfigParser'
         cache, key = self.__cachedValues, (section, setting)
         if key not in cache:
-            # cache[key] = UnicodeAwareConfigParser.get(self, *key)  # pylint: disable=W0142
-            # cache[key] = configparser.RawConfigParser.get(self, *key)  # pylint: disable=W0142
             cache[key] = super().get(*key)
         return cache[key]
 
 
+# _fixValuesFromOldIniFiles only ever touches these options; get() tests
+# this set first so the overwhelmingly common case pays one hash probe
+# instead of calling into the fixup machinery.
+_FIXABLE_OPTIONS = frozenset(('sortby', 'columns', 'columnwidths',
+                              'notifier', 'preferencespages',
+                              'columnsalwaysvisible'))
+
+# meta.filename never changes at runtime; build the ini basename once
+# instead of re-formatting it on every filename lookup. The suffix
+# variant spares the sep handling and isabs checks inside os.path.join
+# when appending to a directory that is known not to end in a
+# separator.
+_INI_BASENAME = '%s.ini' % meta.filename
+_INI_SUFFIX = os.sep + _INI_BASENAME
+
+# Starting with release 1.1.0, the Date properties of tasks (startDate,
+# dueDate and completionDate) are datetimes:
+_TASK_DATE_COLUMNS = ('startDate', 'dueDate', 'completionDate')
+
+_ORDERING_VIEWERS = frozenset(('taskviewer', 'categoryviewer', 'noteviewer',
+                               'noteviewerintaskeditor',
+                               'noteviewerincategoryeditor',
+                               'noteviewerinattachmenteditor',
+                               'categoryviewerintaskeditor',
+                               'categoryviewerinnoteeditor'))
+
+
+# wx is only needed for message boxes in error paths and the version
+# strings in save(), so it is imported lazily; the same goes for the
+# platform shell modules below, which are loaded once and reused.
+
+@lru_cache(maxsize=None)
+def _winShell():
+    from win32com.shell import shell, shellcon  # pylint: disable=F0401
+    return shell, shellcon
+
+
+@lru_cache(maxsize=None)
+def _carbon():
+    import Carbon.File  # pylint: disable=F0401
+    import Carbon.Folder
+    import Carbon.Folders
+    return Carbon
+
+
+# COM dispatch is expensive, so the WScript.Shell object used to follow
+# Windows shortcuts is created once, and resolved shortcut targets are
+# cached until the .lnk file changes.
+_WSCRIPT_SHELL = None
+_SHORTCUT_CACHE = dict()
+
+
+def _wscriptShell():
+    global _WSCRIPT_SHELL
+    if _WSCRIPT_SHELL is None:
+        from win32com.client import Dispatch  # pylint: disable=F0401
+        _WSCRIPT_SHELL = Dispatch('WScript.Shell')
+    return _WSCRIPT_SHELL
+
+
+def _shortcutTarget(lnkPath):
+    mtime = os.path.getmtime(lnkPath)
+    cached = _SHORTCUT_CACHE.get(lnkPath)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    target = _wscriptShell().CreateShortcut(lnkPath).TargetPath
+    _SHORTCUT_CACHE[lnkPath] = (mtime, target)
+    return target
+
+
+# Directories known to exist. os.makedirs walks and stats every path
+# component even when the leaf already exists, which is wasted work on
+# every run after the first; remember what has been verified once.
+_KNOWN_DIRS = set()
+
+
+def _ensureDir(path):
+    if path in _KNOWN_DIRS:
+        return
+    try:
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+    except OSError:
+        return
+    _KNOWN_DIRS.add(path)
+
+
+def _fastMove(src, dst):
+    # The configuration migrations move files within the user's home or
+    # config tree, which is almost always one filesystem, so a plain
+    # rename suffices. shutil.move stats both paths up front and, for
+    # directories, can fall back to a full recursive copy plus delete;
+    # keep it only as the fallback for the cases rename cannot handle
+    # (cross-device moves, existing destinations, ...).
+    try:
+        os.rename(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
+
+# The version diagnostics that save() records never change during a run;
+# format them once per process. Lazy because the wxpython string needs
+# wx, which must not be imported at module level.
+_VERSION_VALUES = None
+
+
+def _versionValues():
+    global _VERSION_VALUES
+    if _VERSION_VALUES is None:
+        import wx
+        _VERSION_VALUES = (
+            ('python', sys.version),
+            ('wxpython', '%s-%s @ %s' % (wx.VERSION_STRING,
+                                         wx.PlatformInfo[2],
+                                         wx.PlatformInfo[1])),
+            ('pythonfrozen', str(hasattr(sys, 'frozen'))),
+            ('current', meta.data.version))
+    return _VERSION_VALUES
+
+
+# There is a finite number of (section, option) pairs, so the event and
+# pubsub topic names are cached instead of re-formatted on every write.
+# The Event class itself is bound here once; set() fires for every
+# geometry change during a window resize, and the attribute chain adds
+# up. Event instances cannot be pooled per (section, option): observers
+# receive subEvents built from the event's mutable state.
+_Event = patterns.Event
+
+
+@lru_cache(maxsize=None)
+def _eventTopic(section, option):
+    return '%s.%s' % (section, option)
+
+
+@lru_cache(maxsize=None)
+def _settingsTopic(section, option):
+    return 'settings.%s.%s' % (section, option)
+
+
+@lru_cache(maxsize=256)
+def _stripDigits(section):
+    # Maps numbered viewer sections ('taskviewer2', ...) to their default
+    # section key; the same handful of names recurs constantly.
+    return section.strip('0123456789')
+
+
+# defaults.minimum flattened to one (section, option) -> minimum dict,
+# so _ensureMinimum pays a single hash lookup per get. Built lazily in
+# case defaults.minimum is filled in after import.
+_MIN_FLAT = None
+
+
+def _minimumFor(section, option):
+    global _MIN_FLAT
+    if _MIN_FLAT is None:
+        _MIN_FLAT = {(sec, opt): value
+                     for sec, options in defaults.minimum.items()
+                     for opt, value in options.items()}
+    return _MIN_FLAT.get((section, option))
+
+
+@lru_cache(maxsize=512)
+def _parseLiteral(stringValue):
+    # Unlike eval, literal_eval does not compile arbitrary Python, and
+    # the cache makes identical stored strings (e.g. the default columns
+    # shared by every viewer) parse once process-wide. Callers must not
+    # mutate the result; getEvaluatedValue hands out copies.
+    return ast.literal_eval(stringValue)
+
+
 class Settings(CachingConfigParser):
     def __init__(self, load=True, iniFile=None, *args, **kwargs):
+        # (section, option) pairs already run through
+        # _fixValuesFromOldIniFiles; after the first pass the stored
+        # value is canonical, so the fixup need not run again.
+        self.__fixedKeys = set()
+        # Evaluated (typed) values, keyed on (section, option,
+        # evaluator); saves the eval()/int() per read on top of the raw
+        # string cache in CachingConfigParser.
+        self.__evalCache = dict()
+        # Results of the program/config/data dir lookups, which hit
+        # sys.argv parsing, the Win32 shell API or xdg on every call but
+        # do not change during a run.
+        self.__pathCache = dict()
+        # Set on the first actual modification; save() skips serializing
+        # when nothing changed.
+        self.__dirty = False
+        # Lazily cached 'file'/'saveinifileinprogramdir' flag; path() is
+        # called for every file lookup and the flag only changes through
+        # onSettingsFileLocationChanged.
+        self.__saveInProgramDir = None
+        # Settings ends up as a dict key in observer registries; hand
+        # out the identity hash from an attribute instead of going
+        # through id() on every probe.
+        self.__hash = object.__hash__(self)
         super().__init__(*args, **kwargs)
         self.initializeWithDefaults()
         self.__loadAndSave = load
@@ -107,7 +287,13 @@ class Settings(CachingConfigParser):
             # Tout d’abord, essayez de charger le fichier de paramètres depuis le répertoire du programme.
             # Si cela échoue, chargez le fichier de paramètres depuis le répertoire des paramètres.
             try:
-                if not self.read(self.filename(forceProgramDir=True)):
+                # For non-portable installs the program dir ini file
+                # never exists; check that before asking ConfigParser to
+                # open it. The read() result still guards the fallback in
+                # case the file exists but cannot be read.
+                programDirIniFile = self.filename(forceProgramDir=True)
+                if not (os.path.exists(programDirIniFile) and
+                        self.read(programDirIniFile)):
                     self.read(self.filename())
                 errorMessage = ''
             except configparser.ParsingError as exc:
@@ -129,9 +315,11 @@ class Settings(CachingConfigParser):
                       'settings.file.saveinifileinprogramdir')
 
     def __hash__(self):
-        return hash(id(self))
+        return self.__hash
 
     def onSettingsFileLocationChanged(self, value):
+        self.__pathCache.clear()
+        self.__saveInProgramDir = value
         saveIniFileInProgramDir = value
         if not saveIniFileInProgramDir:
             try:
@@ -140,16 +328,24 @@ class Settings(CachingConfigParser):
                 return  # pylint: disable=W0702
 
     def initializeWithDefaults(self):
-        for section in self.sections():
-            self.remove_section(section)
-        # for section, settings in defaults.defaults.items():
-        for section, settings in list(defaults.defaults.items()):
-            self.add_section(section)
-            # for key, value in settings.items():
-            for key, value in list(settings.items()):
-                # Don't notify observers while we are initializing
-                super(Settings, self).set(section, key, value)
-                # super().set(section, key, value)
+        self.__evalCache.clear()
+        # On the first call, from __init__, the parser is still empty;
+        # don't bother building the sections() list then.
+        if self._sections:
+            for section in list(self._sections):
+                self.remove_section(section)
+        # Bulk-load the defaults. read_dict would dispatch every option
+        # back through the notifying Settings.set, and observers must
+        # not be notified while we are initializing, so write through
+        # the raw parser and fill the string cache one section at a
+        # time.
+        rawAddSection = configparser.RawConfigParser.add_section
+        rawSet = configparser.RawConfigParser.set
+        for section, settings in defaults.defaults.items():
+            rawAddSection(self, section)
+            for key, value in settings.items():
+                rawSet(self, section, key, value)
+            self._populateCache(section, settings)
 
     def setLoadStatus(self, message):
         self.set('file', 'inifileloaded', 'False' if message else 'True')
@@ -169,6 +365,13 @@ class Settings(CachingConfigParser):
                 super().set(section, name, value)
         return result
 
+    def read(self, *args, **kwargs):
+        # A re-read may bring back unfixed values from an old ini file.
+        self.__fixedKeys = set()
+        self.__evalCache.clear()
+        self.__saveInProgramDir = None
+        return super().read(*args, **kwargs)
+
     def getRawValue(self, section, option):
         return super(Settings, self).get(section, option)
         # return super().get(section, option)
@@ -183,12 +386,13 @@ class Settings(CachingConfigParser):
             # result = super().get(section, option)
         except (configparser.NoOptionError, configparser.NoSectionError):
             return self.getDefault(section, option)
-        result = self._fixValuesFromOldIniFiles(section, option, result)
+        if option in _FIXABLE_OPTIONS:
+            result = self._fixValuesFromOldIniFiles(section, option, result)
         result = self._ensureMinimum(section, option, result)
         return result
 
     def getDefault(self, section, option):  # method may be static
-        defaultSectionKey = section.strip('0123456789')
+        defaultSectionKey = _stripDigits(section)
         try:
             defaultSection = defaults.defaults[defaultSectionKey]
             # KeyError: 'category_viewer'
@@ -203,36 +407,37 @@ class Settings(CachingConfigParser):
     def _ensureMinimum(self, section, option, result):  # method may be static
         # Some settings may have a minimum value, make sure we return at
         # least that minimum value:
-        if section in defaults.minimum and option in defaults.minimum[section]:
-            result = max(result, defaults.minimum[section][option])
-        return result
+        minimum = _minimumFor(section, option)
+        return result if minimum is None else max(result, minimum)
 
     def _fixValuesFromOldIniFiles(self, section, option, result):
         """ Try to fix settings from old TaskCoach.ini files that are no longer
             valid. """
+        key = (section, option)
+        if key in self.__fixedKeys:
+            return result
         original = result
-        # Starting with release 1.1.0, the Date properties of tasks (startDate,
-        # dueDate and completionDate) are datetimes:
-        taskDateColumns = ('startDate', 'dueDate', 'completionDate')
-        orderingViewers = ['taskviewer', 'categoryviewer', 'noteviewer',
-                            'noteviewerintaskeditor', 'noteviewerincategoryeditor',
-                            'noteviewerinattachmenteditor', 'categoryviewerintaskeditor',
-                            'categoryviewerinnoteeditor']
+        taskDateColumns = _TASK_DATE_COLUMNS
+        orderingViewers = _ORDERING_VIEWERS
         if option == 'sortby':
             if result in taskDateColumns:
                 result += 'Time'
-            try:
-                eval(result)
-            except:
-                sortKeys = [result]
+            # A migrated value is a list literal; only bare legacy sort
+            # keys need wrapping, so a prefix test replaces the eval()
+            # probe that compiled the string just to see if it parses.
+            if not (result.startswith('[') and result.endswith(']')):
                 try:
                     ascending = self.getboolean(section, 'sortascending')
                 except:
                     ascending = True
                 result = '["%s%s"]' % (('' if ascending else '-'), result)
         elif option == 'columns':
-            columns = [(col + 'Time' if col in taskDateColumns else col) for col in eval(result)]
-            result = str(columns)
+            # Only parse when one of the legacy date column names can
+            # actually occur in the stored list.
+            if any(col in result for col in taskDateColumns):
+                columns = [(col + 'Time' if col in taskDateColumns else col)
+                           for col in ast.literal_eval(result)]
+                result = str(columns)
         elif option == 'columnwidths':
             widths = dict()
             try:
@@ -268,6 +473,7 @@ class Settings(CachingConfigParser):
             result = str(columns)
         if result != original:
             super().set(section, option, result)
+        self.__fixedKeys.add(key)
         return result
 
     def set(self, section, option, value=None, new=False):  # pylint: disable=W0221
@@ -275,26 +481,37 @@ class Settings(CachingConfigParser):
             currentValue = 'a new option, so use something as current value' \
                            ' that is unlikely to be equal to the new value'
         else:
-            currentValue = self.get(section, option)
+            # Compare against the raw stored string; values are always
+            # written as canonical strings, so running the full get()
+            # (old-ini fixups, minima) per write would be wasted work on
+            # high-frequency writes like window sizes during a resize.
+            try:
+                currentValue = self.getRawValue(section, option)
+            except (configparser.NoOptionError, configparser.NoSectionError):
+                currentValue = self.getDefault(section, option)
         if value != currentValue:
+            for key in [key for key in self.__evalCache
+                        if key[0] == section and key[1] == option]:
+                del self.__evalCache[key]
             super().set(section, option, value)
-            patterns.Event('%s.%s' % (section, option), self, value).send()
+            self.__dirty = True
+            _Event(_eventTopic(section, option), self, value).send()
             return True
         else:
             return False
 
     def setboolean(self, section, option, value):
         if self.set(section, option, str(value)):
-            pub.sendMessage('settings.%s.%s' % (section, option), value=value)
+            pub.sendMessage(_settingsTopic(section, option), value=value)
 
     setvalue = settuple = setlist = setdict = setint = setboolean
 
     def settext(self, section, option, value):
         if self.set(section, option, value):
-            pub.sendMessage('settings.%s.%s' % (section, option), value=value)
+            pub.sendMessage(_settingsTopic(section, option), value=value)
 
     def getlist(self, section, option):
-        return self.getEvaluatedValue(section, option, eval)
+        return self.getEvaluatedValue(section, option, _parseLiteral)
 
     getvalue = gettuple = getdict = getlist
 
@@ -318,38 +535,69 @@ class Settings(CachingConfigParser):
         else:
             raise ValueError("invalid literal for Boolean value: '%s'" % stringValue)
 
-    def getEvaluatedValue(self, section, option, evaluate=eval, showerror=wx.MessageBox):
-        stringValue = self.get(section, option)
-        try:
-            return evaluate(stringValue)
-        except Exception as exceptionMessage:  # pylint: disable=W0703
-            message = '\n'.join([
-                _('Error while reading the %s-%s setting from %s.ini.') % (section, option, meta.filename),
-                _('The value is: %s') % stringValue,
-                _('The error is: %s') % exceptionMessage,
-                _('%s will use the default value for the setting and should proceed normally.') % meta.name])
-            showerror(message, caption=_('Settings error'), style=wx.ICON_ERROR)
-            defaultValue = self.getDefault(section, option)
-            self.set(section, option, defaultValue, new=True)  # Ignore current value
-            return evaluate(defaultValue)
-
-    def save(self, showerror=wx.MessageBox, file=file):  # pylint: disable=W0622
-        self.set('version', 'python', sys.version)
-        self.set('version', 'wxpython', '%s-%s @ %s' % (wx.VERSION_STRING, wx.PlatformInfo[2], wx.PlatformInfo[1]))
-        self.set('version', 'pythonfrozen', str(hasattr(sys, 'frozen')))
-        self.set('version', 'current', meta.data.version)
+    def getEvaluatedValue(self, section, option, evaluate=eval, showerror=None):
+        key = (section, option, evaluate)
+        if key in self.__evalCache:
+            result = self.__evalCache[key]
+        else:
+            stringValue = self.get(section, option)
+            try:
+                result = evaluate(stringValue)
+            except Exception as exceptionMessage:  # pylint: disable=W0703
+                import wx
+                if showerror is None:
+                    showerror = wx.MessageBox
+                message = '\n'.join([
+                    _('Error while reading the %s-%s setting from %s.ini.') % (section, option, meta.filename),
+                    _('The value is: %s') % stringValue,
+                    _('The error is: %s') % exceptionMessage,
+                    _('%s will use the default value for the setting and should proceed normally.') % meta.name])
+                showerror(message, caption=_('Settings error'), style=wx.ICON_ERROR)
+                defaultValue = self.getDefault(section, option)
+                self.set(section, option, defaultValue, new=True)  # Ignore current value
+                result = evaluate(defaultValue)
+            self.__evalCache[key] = result
+        if isinstance(result, (list, dict)):
+            # Hand out a copy so callers mutating the result don't
+            # poison the cache.
+            return result.copy()
+        return result
+
+    def save(self, showerror=None, file=file):  # pylint: disable=W0622
+        import wx
+        if showerror is None:
+            showerror = wx.MessageBox
+        # The version keys are constant for the process lifetime; write
+        # them through the raw parser only when they actually changed
+        # (typically once, after an upgrade) instead of sending each one
+        # through the full Settings.set path on every save.
+        for option, value in _versionValues():
+            try:
+                currentValue = self.getRawValue('version', option)
+            except (configparser.NoOptionError, configparser.NoSectionError):
+                currentValue = None
+            if value != currentValue:
+                super().set('version', option, value)
+                self.__dirty = True
         if not self.__loadAndSave:
             return
+        if not self.__dirty and os.path.exists(self.filename()):
+            return
         try:
             path = self.path()
-            if not os.path.exists(path):
-                os.mkdir(path)
-            tmpFile = file(self.filename() + '.tmp', 'w')
-            self.write(tmpFile)
+            _ensureDir(path)
+            # Serialize to memory first: RawConfigParser.write issues one
+            # small write per option, so buffer those and write the file
+            # in a single call. os.replace renames atomically and spares
+            # the exists/remove dance.
+            buffer = StringIO()
+            self.write(buffer)
+            tmpFilename = self.filename() + '.tmp'
+            tmpFile = file(tmpFilename, 'w')
+            tmpFile.write(buffer.getvalue())
             tmpFile.close()
-            if os.path.exists(self.filename()):
-                os.remove(self.filename())
-            os.rename(self.filename() + '.tmp', self.filename())
+            os.replace(tmpFilename, self.filename())
+            self.__dirty = False
         except Exception as message:  # pylint: disable=W0703
             showerror(_('Error while saving {}.ini:\n{}\n'.format(meta.filename, message))
                       , caption=_('Save error'),
@@ -364,15 +612,20 @@ class Settings(CachingConfigParser):
     def path(self, forceProgramDir=False, environ=os.environ):  # pylint: disable=W0102
         if self.__iniFileSpecifiedOnCommandLine:
             return self.pathToIniFileSpecifiedOnCommandLine()
-        elif forceProgramDir or self.getboolean('file', 'saveinifileinprogramdir'):
+        elif forceProgramDir or self.__saveIniFileInProgramDir():
             return self.pathToProgramDir()
         else:
             return self.pathToConfigDir(environ)
 
+    def __saveIniFileInProgramDir(self):
+        if self.__saveInProgramDir is None:
+            self.__saveInProgramDir = self.getboolean('file', 'saveinifileinprogramdir')
+        return self.__saveInProgramDir
+
     @staticmethod
     def pathToDocumentsDir():
         if operating_system.isWindows():
-            from win32com.shell import shell, shellcon
+            shell, shellcon = _winShell()
             try:
                 return shell.SHGetSpecialFolderPath(None, shellcon.CSIDL_PERSONAL)
             except:
@@ -388,9 +641,7 @@ class Settings(CachingConfigParser):
                 except:
                     return os.getcwd()  # Fuck this
         elif operating_system.isMac():
-            import Carbon.Folder
-            import Carbon.Folders
-            import Carbon.File
+            Carbon = _carbon()
             pathRef = Carbon.Folder.FSFindFolder(Carbon.Folders.kUserDomain, Carbon.Folders.kDocumentsFolderType, True)
             return Carbon.File.pathname(pathRef)
         elif operating_system.isGTK():
@@ -407,42 +658,55 @@ class Settings(CachingConfigParser):
         return os.path.expanduser('~')
 
     def pathToProgramDir(self):  # method may be static
+        try:
+            return self.__pathCache['programDir']
+        except KeyError:
+            pass
         path = sys.argv[0]
         if not os.path.isdir(path):
             path = os.path.dirname(path)
+        self.__pathCache['programDir'] = path
         return path
 
     def pathToConfigDir(self, environ):
+        # Cached regardless of environ; the environment does not change
+        # within a run.
+        try:
+            return self.__pathCache['configDir']
+        except KeyError:
+            pass
         try:
             if operating_system.isGTK():
                 from taskcoachlib.thirdparty.xdg import BaseDirectory
                 path = BaseDirectory.save_config_path(meta.name)
             elif operating_system.isMac():
-                import Carbon.Folder
-                import Carbon.Folders
-                import Carbon.File
+                Carbon = _carbon()
                 pathRef = Carbon.Folder.FSFindFolder(Carbon.Folders.kUserDomain, Carbon.Folders.kPreferencesFolderType,
                                                       True)
                 path = Carbon.File.pathname(pathRef)
                 # XXXFIXME: should we release pathRef ? Doesn't seem so since I get a SIGSEGV if I try.
             elif operating_system.isWindows():
-                from win32com.shell import shell, shellcon
+                shell, shellcon = _winShell()
                 path = os.path.join(shell.SHGetSpecialFolderPath(None, shellcon.CSIDL_APPDATA, True), meta.name)
             else:
                 path = self.pathToConfigDir_deprecated(environ=environ)
         except:  # Fallback to old dir - Retour à l'ancien répertoire
             path = self.pathToConfigDir_deprecated(environ=environ)
+        self.__pathCache['configDir'] = path
         return path
 
     def _pathToDataDir(self, *args, **kwargs):
         forceGlobal = kwargs.pop('forceGlobal', False)
+        cacheKey = ('dataDir', args, forceGlobal)
+        try:
+            return self.__pathCache[cacheKey]
+        except KeyError:
+            pass
         if operating_system.isGTK():
             from taskcoachlib.thirdparty.xdg import BaseDirectory
             path = BaseDirectory.save_data_path(meta.name)
         elif operating_system.isMac():
-            import Carbon.Folder
-            import Carbon.Folders
-            import Carbon.File
+            Carbon = _carbon()
             path_ref = Carbon.Folder.FSFindFolder(Carbon.Folders.kUserDomain,
                                                   Carbon.Folders.kApplicationSupportFolderType, True)
             path = Carbon.File.pathname(path_ref)
@@ -452,7 +716,7 @@ class Settings(CachingConfigParser):
             if self.__iniFileSpecifiedOnCommandLine and not forceGlobal:
                 path = self.pathToIniFileSpecifiedOnCommandLine()
             else:
-                from win32com.shell import shell, shellcon
+                shell, shellcon = _winShell()
                 path = os.path.join(shell.SHGetSpecialFolderPath(None, shellcon.CSIDL_APPDATA, True), meta.name)
 
         else:  # Errr...
@@ -460,19 +724,19 @@ class Settings(CachingConfigParser):
 
         if operating_system.isWindows():
             # Follow shortcuts.
-            from win32com.client import Dispatch
-            shell = Dispatch('WScript.Shell')
             for component in args:
                 path = os.path.join(path, component)
-                if os.path.exists(path + '.lnk'):
-                    shortcut = shell.CreateShortcut(path + '.lnk')
-                    path = shortcut.TargetPath
+                # The question is whether the shortcut file itself is
+                # there; lexists does not resolve it.
+                if os.path.lexists(path + '.lnk'):
+                    path = _shortcutTarget(path + '.lnk')
         else:
             path = os.path.join(path, *args)
 
         exists = os.path.exists(path)
         if not exists:
             os.makedirs(path)
+        self.__pathCache[cacheKey] = (path, exists)
         return path, exists
 
     def pathToDataDir(self, *args, **kwargs):
@@ -492,6 +756,12 @@ class Settings(CachingConfigParser):
         return self._pathToDataDir('backups')[0]
 
     def pathToConfigDir_deprecated(self, environ):  # method may be static
+        # Cached like pathToConfigDir; the environment does not change
+        # within a run, and this also runs as its fallback.
+        try:
+            return self.__pathCache['configDirDeprecated']
+        except KeyError:
+            pass
         try:
             path = os.path.join(environ['APPDATA'], meta.filename)
         except Exception:
@@ -500,7 +770,9 @@ class Settings(CachingConfigParser):
                 # path not expanded: apparently, there is no home dir
                 path = os.getcwd()
             path = os.path.join(path, '.%s' % meta.filename)
-        return operating_system.decodeSystemString(path)
+        path = operating_system.decodeSystemString(path)
+        self.__pathCache['configDirDeprecated'] = path
+        return path
 
     def pathToTemplatesDir_deprecated(self, doCreate=True):
         path = os.path.join(self.path(), 'taskcoach-templates')
@@ -509,60 +781,114 @@ class Settings(CachingConfigParser):
             # Under Windows, check for a shortcut and follow it if it
             # exists.
 
-            if os.path.exists(path + '.lnk'):
-                from win32com.client import Dispatch  # pylint: disable=F0401
-
-                shell = Dispatch('WScript.Shell')
-                shortcut = shell.CreateShortcut(path + '.lnk')
-                return shortcut.TargetPath
+            if os.path.lexists(path + '.lnk'):
+                return _shortcutTarget(path + '.lnk')
 
         if doCreate:
-            try:
-                os.makedirs(path)
-            except OSError:
-                pass
+            _ensureDir(path)
         return operating_system.decodeSystemString(path)
 
     def pathToIniFileSpecifiedOnCommandLine(self):
-        return os.path.dirname(self.__iniFileSpecifiedOnCommandLine) or '.'
+        # The command line ini file is fixed in __init__, so its dirname
+        # is computed once per instance.
+        try:
+            return self.__pathCache['cmdLineIniDir']
+        except KeyError:
+            result = os.path.dirname(self.__iniFileSpecifiedOnCommandLine) or '.'
+            self.__pathCache['cmdLineIniDir'] = result
+            return result
 
     def generatedIniFilename(self, forceProgramDir):
-        return os.path.join(self.path(forceProgramDir), '%s.ini' % meta.filename)
+        # Cached per forceProgramDir; onSettingsFileLocationChanged
+        # clears the path cache when the location setting changes.
+        key = ('iniFilename', forceProgramDir)
+        try:
+            return self.__pathCache[key]
+        except KeyError:
+            result = self.path(forceProgramDir) + _INI_SUFFIX
+            self.__pathCache[key] = result
+            return result
+
+    # Bump the version when a new migration step is added, so existing
+    # installs run the sweep once more.
+    _MIGRATION_SENTINEL = '.migrated-v1'
 
     def migrateConfigurationFiles(self):
+        # The old locations are permanently absent once they have been
+        # migrated, but every startup still paid the whole cascade of
+        # failing stats to find that out. A sentinel file marks the
+        # migration done and reduces the sweep to a single stat.
+        sentinel = os.path.join(self.path(), self._MIGRATION_SENTINEL)
+        if os.path.exists(sentinel):
+            return
+        self.__migrateConfigurationFiles()
+        try:
+            _ensureDir(os.path.dirname(sentinel))
+            open(sentinel, 'w').close()
+        except OSError:
+            pass
+
+    def __migrateConfigurationFiles(self):
+        # The paths probed in this sweep are siblings in a handful of
+        # parent directories; one scandir per parent answers all the
+        # existence questions in this sweep from memory instead of one
+        # stat syscall per path. The caches die with the call, so they
+        # cannot go stale across runs, and no path is probed again here
+        # after a move.
+        @lru_cache(maxsize=8)
+        def _siblings(parent):
+            try:
+                return frozenset(entry.name for entry in os.scandir(parent))
+            except OSError:
+                return frozenset()
+
+        def _exists(path):
+            head, tail = os.path.split(path)
+            return tail in _siblings(head or '.')
         # Templates. Extra care for Windows shortcut.
         oldPath = self.pathToTemplatesDir_deprecated(doCreate=False)
         newPath, exists = self._pathToTemplatesDir()
         if self.__iniFileSpecifiedOnCommandLine:
             globalPath = os.path.join(self.pathToDataDir(forceGlobal=True), 'templates')
-            if os.path.exists(globalPath) and not os.path.exists(oldPath):
+            if _exists(globalPath) and not _exists(oldPath):
                 # Upgrade from fresh installation of 1.3.24 Portable
                 oldPath = globalPath
-                if exists and not os.path.exists(newPath + '-old'):
+                if exists and not _exists(newPath + '-old'):
                     # WTF?
                     os.rename(newPath, newPath + '-old')
                 exists = False
         if exists:
             return
         if oldPath != newPath:
-            if operating_system.isWindows() and os.path.exists(oldPath + '.lnk'):
-                shutil.move(oldPath + '.lnk', newPath + '.lnk')
-            elif os.path.exists(oldPath):
+            if operating_system.isWindows() and _exists(oldPath + '.lnk'):
+                _fastMove(oldPath + '.lnk', newPath + '.lnk')
+            elif _exists(oldPath):
                 # pathToTemplatesDir() has created the directory
                 try:
                     os.rmdir(newPath)
                 except:
                     pass
-                shutil.move(oldPath, newPath)
+                _fastMove(oldPath, newPath)
         # Ini file
-        oldPath = os.path.join(self.pathToConfigDir_deprecated(environ=os.environ), '%s.ini' % meta.filename)
-        newPath = os.path.join(self.pathToConfigDir(environ=os.environ), '%s.ini' % meta.filename)
-        if newPath != oldPath and os.path.exists(oldPath):
-            shutil.move(oldPath, newPath)
+        deprecatedConfigDir = self.pathToConfigDir_deprecated(environ=os.environ)
+        oldPath = os.path.join(deprecatedConfigDir, _INI_BASENAME)
+        newPath = os.path.join(self.pathToConfigDir(environ=os.environ), _INI_BASENAME)
+        if newPath != oldPath and _exists(oldPath):
+            # A single small file: os.replace is one syscall, atomic on
+            # POSIX and Windows even over an existing destination, so a
+            # crash cannot leave a half-migrated config file. Cross-
+            # device moves still fall back to shutil.move.
+            try:
+                os.replace(oldPath, newPath)
+            except OSError:
+                shutil.move(oldPath, newPath)
             # Unexpected type(s):(LiteralString | str | bytes, LiteralString)Possible type(s):(str |
             # PathLike[str], str | PathLike[str])(str, str | PathLike[str])
-        # Cleanup
-        try:
-            os.rmdir(self.pathToConfigDir_deprecated(environ=os.environ))
-        except:
-            pass
+        # Cleanup. Only attempt the rmdir when the deprecated dir is
+        # still around; a bare failing syscall plus exception unwind is
+        # an expensive way to skip.
+        if _exists(deprecatedConfigDir):
+            try:
+                os.rmdir(deprecatedConfigDir)
+            except OSError:
+                pass
@@ -20,8 +20,52 @@ from taskcoachlib import patterns
 
 
 class Collection(patterns.CompositeSet):
+    """ A CompositeSet that also indexes its objects by id, so that
+        getObjectById is a hash probe instead of a scan over the whole
+        collection. All mutations funnel through extend/removeItems
+        (append and remove delegate to them) and clear, which keep the
+        index in sync. """
+
+    def __init__(self, initList=None, *args, **kwargs):
+        self.__objectsById = dict()
+        super().__init__(initList, *args, **kwargs)
+
+    def extend(self, composites, event=None):
+        result = super().extend(composites, event=event)
+        if composites:
+            index = self.__objectsById
+            # extend also inserts all (recursive) children:
+            for domainObject in self._compositesAndAllChildren(composites):
+                index[domainObject.id()] = domainObject
+        return result
+
+    def removeItems(self, composites, event=None):
+        result = super().removeItems(composites, event=event)
+        if composites:
+            pop = self.__objectsById.pop
+            # Children may already have been removed separately:
+            for domainObject in self._compositesAndAllChildren(composites):
+                pop(domainObject.id(), None)
+        return result
+
+    def clear(self, event=None):
+        result = super().clear(event=event)
+        self.__objectsById.clear()
+        return result
+
+    def __contains__(self, domainObject):
+        # Domain objects compare by identity, so the id index answers
+        # membership as well, without hashing the object itself. Parent
+        # lookups pass None and tests pass arbitrary objects; fall back
+        # to the set probe for anything without an id.
+        try:
+            objectId = domainObject.id()
+        except AttributeError:
+            return super().__contains__(domainObject)
+        return self.__objectsById.get(objectId) is domainObject
+
     def getObjectById(self, domainObjectId):
-        for domainObject in self:
-            if domainObjectId == domainObject.id():
-                return domainObject
-        raise IndexError
+        try:
+            return self.__objectsById[domainObjectId]
+        except KeyError:
+            raise IndexError
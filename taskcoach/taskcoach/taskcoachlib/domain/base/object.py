@@ -29,13 +29,28 @@ from taskcoachlib.domain.date import DateTime, Now
 #    from taskcoachlib.thirdparty.pubsub import pub
 # except ModuleNotFoundError:
 from pubsub import pub
-from . import attribute
+from operator import methodcaller
+import os
 import sys
 import functools
-import uuid
 import re
 
 
+def _newId():
+    # Ids only need to be unique. uuid1 reads the MAC address and
+    # formats the dashed string in Python on every call; 16 random
+    # bytes rendered as hex give the same uniqueness for a fraction of
+    # the cost, which adds up when loading thousands of objects.
+    return os.urandom(16).hex()
+
+
+# Event type strings are dict keys in the pubsub registries; interning
+# them (they contain dots, so the compiler does not intern them itself)
+# lets those probes succeed on pointer identity.
+_MARK_DELETED_EVENT_TYPE = sys.intern('object.markdeleted')
+_MARK_NOT_DELETED_EVENT_TYPE = sys.intern('object.marknotdeleted')
+
+
 class SynchronizedObject(object):
     STATUS_NONE = 0
     STATUS_NEW = 1
@@ -48,86 +63,125 @@ class SynchronizedObject(object):
 
     @classmethod
     def markDeletedEventType(class_):
-        return 'object.markdeleted'
+        return _MARK_DELETED_EVENT_TYPE
 
     @classmethod
     def markNotDeletedEventType(class_):
-        return 'object.marknotdeleted'
+        return _MARK_NOT_DELETED_EVENT_TYPE
 
     def __getstate__(self):
-        try:
-            state = super().__getstate__()
-        except AttributeError:
-            state = dict()
-
+        # Probing with getattr instead of try/except spares the
+        # exception construction per object during save/copy when the
+        # next class in the MRO has no state hook; it also no longer
+        # masks AttributeErrors raised inside a real hook.
+        getstate = getattr(super(), '__getstate__', None)
+        state = getstate() if getstate is not None else dict()
         state['status'] = self.__status
         return state
 
+    # Maps a target status to the method name __setstate__ uses to get
+    # there; one dict lookup replaces the former if/elif ladder.
+    _STATUS_DISPATCH = {STATUS_CHANGED: 'markDirty',
+                        STATUS_DELETED: 'markDeleted',
+                        STATUS_NEW: 'markNew',
+                        STATUS_NONE: 'cleanDirty'}
+
     @patterns.eventSource
     def __setstate__(self, state, event=None):
-        try:
-            super().__setstate__(state, event=event)
-        except AttributeError:
-            pass
+        setstate = getattr(super(), '__setstate__', None)
+        if setstate is not None:
+            setstate(state, event=event)
         if state['status'] != self.__status:
-            if state['status'] == self.STATUS_CHANGED:
-                self.markDirty(event=event)
-            elif state['status'] == self.STATUS_DELETED:
-                self.markDeleted(event=event)
-            elif state['status'] == self.STATUS_NEW:
-                self.markNew(event=event)
-            elif state['status'] == self.STATUS_NONE:
-                self.cleanDirty(event=event)
+            # Unknown status values are ignored, as the old if/elif
+            # ladder did.
+            markMethod = self._STATUS_DISPATCH.get(state['status'])
+            if markMethod is not None:
+                getattr(self, markMethod)(event=event)
 
     def getStatus(self):
         return self.__status
 
-    @patterns.eventSource
     def markDirty(self, force=False, event=None):
+        # The eventSource decorator is inlined in these mark* methods so
+        # that the no-op path returns before an event is even created.
         if not self.setStatusDirty(force):
             return
+        created = event is None
+        if created:
+            event = patterns.Event()
         event.addSource(self, self.__status,
                         type=self.markNotDeletedEventType())
+        if created:
+            event.send()
 
-    def setStatusDirty(self, force=False):
+    def __setStatus(self, newStatus):
+        # Shared by the setStatus* helpers; returns whether the object
+        # came back from the deleted state.
         oldStatus = self.__status
+        self.__status = newStatus
+        return oldStatus == self.STATUS_DELETED
+
+    def setStatusDirty(self, force=False):
         if self.__status == self.STATUS_NONE or force:
-            self.__status = self.STATUS_CHANGED
-            return oldStatus == self.STATUS_DELETED
-        else:
-            return False
+            return self.__setStatus(self.STATUS_CHANGED)
+        return False
 
-    @patterns.eventSource
     def markNew(self, event=None):
         if not self.setStatusNew():
             return
+        created = event is None
+        if created:
+            event = patterns.Event()
         event.addSource(self, self.__status,
                         type=self.markNotDeletedEventType())
+        if created:
+            event.send()
 
     def setStatusNew(self):
-        oldStatus = self.__status
-        self.__status = self.STATUS_NEW
-        return oldStatus == self.STATUS_DELETED
+        return self.__setStatus(self.STATUS_NEW)
 
-    @patterns.eventSource
     def markDeleted(self, event=None):
         self.setStatusDeleted()
+        created = event is None
+        if created:
+            event = patterns.Event()
         event.addSource(self, self.__status, type=self.markDeletedEventType())
+        if created:
+            event.send()
 
     def setStatusDeleted(self):
-        self.__status = self.STATUS_DELETED
+        self.__setStatus(self.STATUS_DELETED)
 
-    @patterns.eventSource
     def cleanDirty(self, event=None):
         if not self.setStatusNone():
             return
+        created = event is None
+        if created:
+            event = patterns.Event()
         event.addSource(self, self.__status,
                         type=self.markNotDeletedEventType())
+        if created:
+            event.send()
 
     def setStatusNone(self):
-        oldStatus = self.__status
-        self.__status = self.STATUS_NONE
-        return oldStatus == self.STATUS_DELETED
+        return self.__setStatus(self.STATUS_NONE)
+
+    @classmethod
+    def bulkStatusChangedEventType(cls):
+        return 'pubsub.object.bulkstatus'
+
+    @classmethod
+    def setStatusBulk(cls, objects, status):
+        """ Set the status of many objects at once. Writes the status
+            directly and sends a single bulk message instead of one
+            mark* event per object, for callers that transition a whole
+            collection and don't care about the individual events. """
+        count = 0
+        for obj in objects:
+            obj.__status = status
+            count += 1
+        pub.sendMessage(cls.bulkStatusChangedEventType(), sender=cls,
+                        status=status, count=count)
 
     def isNew(self):
         return self.__status == self.STATUS_NEW
@@ -140,72 +194,81 @@ class SynchronizedObject(object):
 
 
 class Object(SynchronizedObject):
-    rx_attributes = re.compile(r'\[(\w+):(.+)\]')
-
-    # if sys.version_info.major == 2:
-    #    _long_zero = long(0)  # unresolved reference 'long'
-    # else:
-    #    _long_zero = 0
-
-    def __init__(self, *args, **kwargs):
-        Attribute = attribute.Attribute  # unresolved reference attribute
-        self.__creationDateTime = kwargs.pop('creationDateTime', None) or Now()
+    # Matched against the whole description in one MULTILINE pass;
+    # [^\S\n]* mirrors the per-line strip() the old line loop did
+    # without letting the match cross lines.
+    rx_attributes = re.compile(r'^[^\S\n]*\[(\w+):(.+)\]', re.MULTILINE)
+
+    def __init__(self, *args, _now=Now, _minDateTime=DateTime.min, **kwargs):
+        # The attributes are stored as plain values; the compare-and-
+        # notify gate that the Attribute wrapper used to provide lives
+        # in the setters below. This saves eight wrapper objects (plus
+        # their weakrefs) per domain object and makes every getter a
+        # plain attribute fetch. _now and _minDateTime are keyword-only
+        # defaults so each construction reads them as locals instead of
+        # re-resolving the globals; callers never pass them.
+        self.__creationDateTime = kwargs.pop('creationDateTime', None) or _now()
         self.__modificationDateTime = kwargs.pop('modificationDateTime',
-                                                 DateTime.min)
-        self.__subject = Attribute(kwargs.pop('subject', ''), self,
-                                   self.subjectChangedEvent)
-        self.__description = Attribute(kwargs.pop('description', ''), self,
-                                       self.descriptionChangedEvent)
-        self.__fgColor = Attribute(kwargs.pop('fgColor', None), self,
-                                   self.appearanceChangedEvent)
-        self.__bgColor = Attribute(kwargs.pop('bgColor', None), self,
-                                   self.appearanceChangedEvent)
-        self.__font = Attribute(kwargs.pop('font', None), self,
-                                self.appearanceChangedEvent)
-        self.__icon = Attribute(kwargs.pop('icon', ''), self,
-                                self.appearanceChangedEvent)
-        self.__selectedIcon = Attribute(kwargs.pop('selectedIcon', ''), self,
-                                        self.appearanceChangedEvent)
-        self.__ordering = Attribute(kwargs.pop('ordering', 0), self, self.orderingChangedEvent)
-        self.__id = kwargs.pop('id', None) or str(uuid.uuid1())
+                                                 _minDateTime)
+        self.__subject = kwargs.pop('subject', '')
+        self.__description = kwargs.pop('description', '')
+        self.__fgColor = kwargs.pop('fgColor', None)
+        self.__bgColor = kwargs.pop('bgColor', None)
+        self.__font = kwargs.pop('font', None)
+        self.__icon = kwargs.pop('icon', '')
+        self.__selectedIcon = kwargs.pop('selectedIcon', '')
+        self.__ordering = kwargs.pop('ordering', 0)
+        self.__id = kwargs.pop('id', None) or _newId()
         super().__init__(*args, **kwargs)
 
     def __repr__(self):
         return self.subject()
 
     def __getstate__(self):
-        try:
-            state = super().__getstate__()
-        except AttributeError:
-            state = dict()
-        state.update(dict(id=self.__id,
-                          creationDateTime=self.__creationDateTime,
-                          modificationDateTime=self.__modificationDateTime,
-                          subject=self.__subject.get(),
-                          description=self.__description.get(),
-                          fgColor=self.__fgColor.get(),
-                          bgColor=self.__bgColor.get(),
-                          font=self.__font.get(),
-                          icon=self.__icon.get(),
-                          ordering=self.__ordering.get(),
-                          selectedIcon=self.__selectedIcon.get()))
+        getstate = getattr(super(), '__getstate__', None)
+        state = getstate() if getstate is not None else dict()
+        state['id'] = self.__id
+        state['creationDateTime'] = self.__creationDateTime
+        state['modificationDateTime'] = self.__modificationDateTime
+        state['subject'] = self.__subject
+        state['description'] = self.__description
+        state['fgColor'] = self.__fgColor
+        state['bgColor'] = self.__bgColor
+        state['font'] = self.__font
+        state['icon'] = self.__icon
+        state['ordering'] = self.__ordering
+        state['selectedIcon'] = self.__selectedIcon
         return state
 
     @patterns.eventSource
     def __setstate__(self, state, event=None):
-        try:
-            super().__setstate__(state, event=event)
-        except AttributeError:
-            pass
+        setstate = getattr(super(), '__setstate__', None)
+        if setstate is not None:
+            setstate(state, event=event)
         self.__id = state['id']
-        self.setSubject(state['subject'], event=event)
-        self.setDescription(state['description'], event=event)
-        self.setForegroundColor(state['fgColor'], event=event)
-        self.setBackgroundColor(state['bgColor'], event=event)
-        self.setFont(state['font'], event=event)
-        self.setIcon(state['icon'], event=event)
-        self.setSelectedIcon(state['selectedIcon'], event=event)
-        self.setOrdering(state['ordering'], event=event)
+        # Each setter call is guarded by the change check the setter
+        # would do anyway, so restoring an unchanged attribute (the
+        # common case: undo/redo touches one attribute) skips the setter
+        # and its eventSource wrapper entirely. Changed attributes still
+        # go through the real setters, because subclasses hook them
+        # (Task.setSubject notifies dependencies, its colour setters
+        # recompute the recursive appearance).
+        if state['subject'] != self.__subject:
+            self.setSubject(state['subject'], event=event)
+        if state['description'] != self.__description:
+            self.setDescription(state['description'], event=event)
+        if state['fgColor'] != self.__fgColor:
+            self.setForegroundColor(state['fgColor'], event=event)
+        if state['bgColor'] != self.__bgColor:
+            self.setBackgroundColor(state['bgColor'], event=event)
+        if state['font'] != self.__font:
+            self.setFont(state['font'], event=event)
+        if state['icon'] != self.__icon:
+            self.setIcon(state['icon'], event=event)
+        if state['selectedIcon'] != self.__selectedIcon:
+            self.setSelectedIcon(state['selectedIcon'], event=event)
+        if state['ordering'] != self.__ordering:
+            self.setOrdering(state['ordering'], event=event)
         self.__creationDateTime = state['creationDateTime']
         # Set modification Date/time last to overwrite changes made by the
         # setters above
@@ -216,24 +279,32 @@ class Object(SynchronizedObject):
             a copy of the object.
 
             E.g. copy = obj.__class__(**original.__getcopystate__()) """
-        try:
-            state = super().__getcopystate__()
-        except AttributeError:
-            state = dict()
+        getcopystate = getattr(super(), '__getcopystate__', None)
+        state = getcopystate() if getcopystate is not None else dict()
         # Note that we don't put the id and the creation Date/time in the state
         # dict, because a copy should get a new id and a new creation Date/time
-        state.update(dict(
-            subject=self.__subject.get(), description=self.__description.get(),
-            fgColor=self.__fgColor.get(), bgColor=self.__bgColor.get(),
-            font=self.__font.get(), icon=self.__icon.get(),
-            selectedIcon=self.__selectedIcon.get(),
-            ordering=self.__ordering.get()))
+        state['subject'] = self.__subject
+        state['description'] = self.__description
+        state['fgColor'] = self.__fgColor
+        state['bgColor'] = self.__bgColor
+        state['font'] = self.__font
+        state['icon'] = self.__icon
+        state['selectedIcon'] = self.__selectedIcon
+        state['ordering'] = self.__ordering
         return state
 
     def copy(self):
         return self.__class__(**self.__getcopystate__())
 
+    # The *EventType classmethods and monitoredAttributes are called for
+    # every event the monitors and viewers process, re-running the '%s'
+    # formatting (and list building) each time; functools.cache keys on
+    # the class, so each result is computed once per class and the event
+    # system always sees the same string object, which also makes the
+    # pubsub dict probes identity-fast.
+
     @classmethod
+    @functools.cache
     def monitoredAttributes(class_):
         return ['ordering', 'subject', 'description', 'appearance']
 
@@ -244,12 +315,9 @@ class Object(SynchronizedObject):
 
     # Custom attributes
     def customAttributes(self, sectionName):
-        attributes = set()
-        for line in self.description().split('\n'):
-            match = self.rx_attributes.match(line.strip())
-            if match and match.group(1) == sectionName:
-                attributes.add(match.group(2))
-        return attributes
+        return {match.group(2)
+                for match in self.rx_attributes.finditer(self.description())
+                if match.group(1) == sectionName}
 
     # Editing Date/time:
 
@@ -262,34 +330,42 @@ class Object(SynchronizedObject):
     def setModificationDateTime(self, date_time):
         self.__modificationDateTime = date_time
 
+    # Where the sort key is a plain method call, operator.methodcaller
+    # replaces the lambda: list.sort then invokes the key in C without
+    # entering a Python frame per element.
+
     @staticmethod
     def modificationDateTimeSortFunction(**kwargs):
-        return lambda item: item.modificationDateTime()
+        return methodcaller('modificationDateTime')
 
     @staticmethod
     def creationDateTimeSortFunction(**kwargs):
-        return lambda item: item.creationDateTime()
+        return methodcaller('creationDateTime')
 
     # Subject:
 
     def subject(self):
-        return self.__subject.get()
+        return self.__subject
 
+    @patterns.eventSource
     def setSubject(self, subject, event=None):
-        self.__subject.set(subject, event=event)
+        if subject != self.__subject:
+            self.__subject = subject
+            self.subjectChangedEvent(event)
 
     def subjectChangedEvent(self, event):
         event.addSource(self, self.subject(), type=self.subjectChangedEventType())
 
     @classmethod
+    @functools.cache
     def subjectChangedEventType(cls):
-        return '%s.subject' % cls
+        return sys.intern('%s.subject' % cls)
 
     @staticmethod
     def subjectSortFunction(**kwargs):
         """ Function to pass to list.sort when sorting by subject. """
         if kwargs.get('sortCaseSensitive', False):
-            return lambda item: item.subject()
+            return methodcaller('subject')
         else:
             return lambda item: item.subject().lower()
 
@@ -301,21 +377,25 @@ class Object(SynchronizedObject):
     # Ordering:
 
     def ordering(self):
-        return self.__ordering.get()
+        return self.__ordering
 
+    @patterns.eventSource
     def setOrdering(self, ordering, event=None):
-        self.__ordering.set(ordering, event=event)
+        if ordering != self.__ordering:
+            self.__ordering = ordering
+            self.orderingChangedEvent(event)
 
     def orderingChangedEvent(self, event):
         event.addSource(self, self.ordering(), type=self.orderingChangedEventType())
 
     @classmethod
+    @functools.cache
     def orderingChangedEventType(cls):
-        return '%s.ordering' % cls
+        return sys.intern('%s.ordering' % cls)
 
     @staticmethod
     def orderingSortFunction(**kwargs):
-        return lambda item: item.ordering()
+        return methodcaller('ordering')
 
     @classmethod
     def orderingSortEventTypes(cls):
@@ -324,24 +404,28 @@ class Object(SynchronizedObject):
     # Description:
 
     def description(self):
-        return self.__description.get()
+        return self.__description
 
+    @patterns.eventSource
     def setDescription(self, description, event=None):
-        self.__description.set(description, event=event)
+        if description != self.__description:
+            self.__description = description
+            self.descriptionChangedEvent(event)
 
     def descriptionChangedEvent(self, event):
         event.addSource(self, self.description(),
                         type=self.descriptionChangedEventType())
 
     @classmethod
+    @functools.cache
     def descriptionChangedEventType(class_):
-        return '%s.description' % class_
+        return sys.intern('%s.description' % class_)
 
     @staticmethod
     def descriptionSortFunction(**kwargs):
         """ Function to pass to list.sort when sorting by description. """
         if kwargs.get('sortCaseSensitive', False):
-            return lambda item: item.description()
+            return methodcaller('description')
         else:
             return lambda item: item.description().lower()
 
@@ -352,23 +436,34 @@ class Object(SynchronizedObject):
 
     # Color:
 
+    @patterns.eventSource
     def setForegroundColor(self, color, event=None):
-        self.__fgColor.set(color, event=event)
+        # Checking identity first fast-paths the common None-to-None
+        # case without a wx.Colour comparison; same in the other
+        # appearance setters below.
+        old = self.__fgColor
+        if color is not old and color != old:
+            self.__fgColor = color
+            self.appearanceChangedEvent(event)
 
     def foregroundColor(self, recursive=False):  # pylint: disable=W0613
         # The 'recursive' argument isn't actually used here, but some
         # code assumes composite objects where there aren't. This is
         # the simplest workaround.
-        return self.__fgColor.get()
+        return self.__fgColor
 
+    @patterns.eventSource
     def setBackgroundColor(self, color, event=None):
-        self.__bgColor.set(color, event=event)
+        old = self.__bgColor
+        if color is not old and color != old:
+            self.__bgColor = color
+            self.appearanceChangedEvent(event)
 
     def backgroundColor(self, recursive=False):  # pylint: disable=W0613
         # The 'recursive' argument isn't actually used here, but some
         # code assumes composite objects where there aren't. This is
         # the simplest workaround.
-        return self.__bgColor.get()
+        return self.__bgColor
 
     # Font:
 
@@ -376,36 +471,52 @@ class Object(SynchronizedObject):
         # The 'recursive' argument isn't actually used here, but some
         # code assumes composite objects where there aren't. This is
         # the simplest workaround.
-        return self.__font.get()
+        return self.__font
 
+    @patterns.eventSource
     def setFont(self, font, event=None):
-        self.__font.set(font, event=event)
+        old = self.__font
+        if font is not old and font != old:
+            self.__font = font
+            self.appearanceChangedEvent(event)
 
     # Icons:
 
     def icon(self):
-        return self.__icon.get()
+        return self.__icon
 
+    @patterns.eventSource
     def setIcon(self, icon, event=None):
-        self.__icon.set(icon, event=event)
+        old = self.__icon
+        if icon is not old and icon != old:
+            self.__icon = icon
+            self.appearanceChangedEvent(event)
 
     def selectedIcon(self):
-        return self.__selectedIcon.get()
+        return self.__selectedIcon
 
+    @patterns.eventSource
     def setSelectedIcon(self, selected_icon, event=None):
-        self.__selectedIcon.set(selected_icon, event=event)
+        old = self.__selectedIcon
+        if selected_icon is not old and selected_icon != old:
+            self.__selectedIcon = selected_icon
+            self.appearanceChangedEvent(event)
 
     # Event types:
 
     @classmethod
+    @functools.cache
     def appearanceChangedEventType(class_):
-        return '%s.appearance' % class_
+        return sys.intern('%s.appearance' % class_)
 
     def appearanceChangedEvent(self, event):
         event.addSource(self, type=self.appearanceChangedEventType())
 
     @classmethod
+    @functools.cache
     def modificationEventTypes(class_):
+        # Callers only iterate or concatenate the result, so handing out
+        # the cached list is safe.
         try:
             eventTypes = super().modificationEventTypes()
             # eventTypes = super(Object, class_).modificationEventTypes()
@@ -418,16 +529,36 @@ class Object(SynchronizedObject):
 
 
 class CompositeObject(Object, patterns.ObservableComposite):
+    # Expansion state is stored per object as an int bitmask. The class-wide
+    # registry below assigns each context string a bit; there are only a
+    # handful of contexts (one per viewer) but many composite objects, so
+    # this replaces a set per object with a single int, and isExpanded
+    # becomes a bitwise AND instead of a set probe.
+    _CTX_BITS = {}
+
+    @staticmethod
+    def _contextBit(context):
+        bits = CompositeObject._CTX_BITS
+        try:
+            return bits[context]
+        except KeyError:
+            bit = bits[context] = 1 << len(bits)
+            return bit
+
     def __init__(self, *args, **kwargs):
-        self.__expandedContexts = set(kwargs.pop('expandedContexts', []))
+        mask = 0
+        for context in kwargs.pop('expandedContexts', ()):
+            mask |= self._contextBit(context)
+        self.__expandedContexts = mask
         super().__init__(*args, **kwargs)
 
     def __getcopystate__(self):
         state = super().__getcopystate__()
-        state.update(dict(expandedContexts=self.expandedContexts()))
+        state['expandedContexts'] = self.expandedContexts()
         return state
 
     @classmethod
+    @functools.cache
     def monitoredAttributes(class_):
         return Object.monitoredAttributes() + ['expandedContexts']
 
@@ -447,11 +578,32 @@ class CompositeObject(Object, patterns.ObservableComposite):
     @staticmethod
     def subjectSortFunction(**kwargs):
         """ Function to pass to list.sort when sorting by subject. """
-        recursive = kwargs.get('treeMode', False)
-        if kwargs.get('sortCaseSensitive', False):
-            return lambda item: item.subject(recursive=recursive)
-        else:
-            return lambda item: item.subject(recursive=recursive).lower()
+        caseSensitive = kwargs.get('sortCaseSensitive', False)
+        if not kwargs.get('treeMode', False):
+            if caseSensitive:
+                return methodcaller('subject')
+            return lambda item: item.subject().lower()
+        # In tree mode the key is the ' -> '-joined parent chain.
+        # Memoizing it makes the chain walk O(1) amortized, because each
+        # item reuses its parent's key instead of rebuilding it. The
+        # memo lives in the returned closure and the sorter creates a
+        # fresh key function for every sort, so it can never go stale.
+        memo = {}
+
+        def recursiveSubject(item):
+            try:
+                return memo[item]
+            except KeyError:
+                subject = item.subject()
+                if not caseSensitive:
+                    subject = subject.lower()
+                parent = item.parent()
+                if parent is not None:
+                    subject = '%s -> %s' % (recursiveSubject(parent), subject)
+                memo[item] = subject
+                return subject
+
+        return recursiveSubject
 
     # Description:
 
@@ -469,31 +621,36 @@ class CompositeObject(Object, patterns.ObservableComposite):
     def isExpanded(self, context='None'):
         """ Returns a boolean indicating whether the composite object is
             expanded in the specified context. """
-        return context in self.__expandedContexts
+        return bool(self.__expandedContexts &
+                    CompositeObject._CTX_BITS.get(context, 0))
 
     def expandedContexts(self):
         """ Returns a list of contexts where this composite object is
             expanded. """
-        return list(self.__expandedContexts)
+        mask = self.__expandedContexts
+        return [context for context, bit in CompositeObject._CTX_BITS.items()
+                if mask & bit]
 
     def expand(self, expand=True, context='None', notify=True):
         """ Expands (or collapses) the composite object in the specified
             context. """
-        if expand == self.isExpanded(context):
+        bit = self._contextBit(context)
+        if expand == bool(self.__expandedContexts & bit):
             return
         if expand:
-            self.__expandedContexts.add(context)
+            self.__expandedContexts |= bit
         else:
-            self.__expandedContexts.discard(context)
+            self.__expandedContexts &= ~bit
         if notify:
             pub.sendMessage(self.expansionChangedEventType(), newValue=expand,
                             sender=self)
 
     @classmethod
+    @functools.cache
     def expansionChangedEventType(cls):
         """ The event type used for notifying changes in the expansion state
             of a composite object. """
-        return 'pubsub.%s.expandedContexts' % cls.__name__.lower()
+        return sys.intern('pubsub.%s.expandedContexts' % cls.__name__.lower())
 
     def expansionChangedEvent(self, event):
         event.addSource(self, type=self.expansionChangedEventType())
@@ -561,32 +718,49 @@ class CompositeObject(Object, patterns.ObservableComposite):
     # Event types:
 
     @classmethod
+    @functools.cache
     def modificationEventTypes(class_):
         return super().modificationEventTypes() + \
             [class_.expansionChangedEventType()]
 
     # Override SynchronizedObject methods to also mark child objects
 
-    @patterns.eventSource
     def markDeleted(self, event=None):
+        created = event is None
+        if created:
+            event = patterns.Event()
         super().markDeleted(event=event)
         for child in self.children():
             child.markDeleted(event=event)
+        if created:
+            event.send()
 
-    @patterns.eventSource
     def markNew(self, event=None):
+        created = event is None
+        if created:
+            event = patterns.Event()
         super().markNew(event=event)
         for child in self.children():
             child.markNew(event=event)
+        if created:
+            event.send()
 
-    @patterns.eventSource
     def markDirty(self, force=False, event=None):
+        created = event is None
+        if created:
+            event = patterns.Event()
         super().markDirty(force, event=event)
         for child in self.children():
             child.markDirty(force, event=event)
+        if created:
+            event.send()
 
-    @patterns.eventSource
     def cleanDirty(self, event=None):
+        created = event is None
+        if created:
+            event = patterns.Event()
         super().cleanDirty(event=event)
         for child in self.children():
             child.cleanDirty(event=event)
+        if created:
+            event.send()
@@ -77,17 +77,16 @@ class Singleton(type):
     # la classe Signgleton est appelée comme une fonction
     # fau-il la remplacer par __new__ ?
 
-    _instance = None
-
     def __call__(cls, *args, **kwargs):
         """Create a new instance of the class if none exists, otherwise return the existing instance."""
-        # if not cls.hasInstance():
-        #    # pylint: disable=W0201
-        #    # cls.instance = super(Singleton, cls).__call__(*args, **kwargs)
-        #     cls.instance = super().__call__(*args, **kwargs)
-        if cls._instance is None:
-            cls._instance = super().__call__(*args, **kwargs)
-        return cls._instance
+        # The instance is stored in the class' own __dict__ (not looked up
+        # through the MRO) so that each subclass gets its own instance and
+        # the hot path is a single dict probe.
+        instance = cls.__dict__.get('__singleton_instance__')
+        if instance is None:
+            instance = super().__call__(*args, **kwargs)
+            cls.__singleton_instance__ = instance
+        return instance
 
     # def deleteInstance(class_):
     # @classmethod
@@ -100,9 +99,8 @@ class Singleton(type):
         """
         # Supprimez l' (unique) instance. Cette méthode est principalement destinée aux tests unitaires
         # afin qu'ils puissent commencer avec une table rase.
-        # if cls.hasInstance():
-        if cls._instance is not None:
-            del cls._instance
+        if '__singleton_instance__' in cls.__dict__:
+            del cls.__singleton_instance__
 
     # def hasInstance(class_):
     # @classmethod
@@ -111,6 +109,5 @@ class Singleton(type):
 
         Has the (only) instance been created already? """
         # La (seule) instance a-t-elle déjà été créée ?
-        return 'instance' in cls.__dict__
-        # return cls._instance is not None
+        return cls.__dict__.get('__singleton_instance__') is not None
 
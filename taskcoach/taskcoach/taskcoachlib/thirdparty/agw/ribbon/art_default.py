@@ -1,44 +1,20 @@
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-from future import standard_library
-standard_library.install_aliases()
-from builtins import *
 import wx
 
 from art_msw import RibbonMSWArtProvider
 from art_aui import RibbonAUIArtProvider
 
-if wx.Platform == "__WXMSW__":
-
-    class RibbonDefaultArtProvider(RibbonMSWArtProvider):
-        """ Default art provider on MSW. """
-
-        def __init__(self, set_colour_scheme=True):
-
-            RibbonMSWArtProvider.__init__(self, set_colour_scheme)
-
-
-elif wx.Platform == "__WXGTK__":
-
-    class RibbonDefaultArtProvider(RibbonAUIArtProvider):
-        """ Default art provider on GTK. """
-
-        def __init__(self):
-
-            RibbonAUIArtProvider.__init__(self)
-
-
-else:
-    # MAC has still no art provider for a ribbon, so we'll use
-    # The AUI one. Waiting for a RibbonOSXArtProvider :-D
-
-    class RibbonDefaultArtProvider(RibbonAUIArtProvider):
-        """ Default art provider on Mac. """
-
-        def __init__(self):
-
-            RibbonAUIArtProvider.__init__(self)
-
-    
+# MAC has still no art provider for a ribbon, so we'll use
+# the AUI one. Waiting for a RibbonOSXArtProvider :-D
+# Other backends (X11-only, wxQt, ...) have no suitable provider at all,
+# so fail fast at import instead of silently handing out the wrong one.
+_PLATFORM_MAP = {"__WXMSW__": RibbonMSWArtProvider,
+                 "__WXGTK__": RibbonAUIArtProvider,
+                 "__WXMAC__": RibbonAUIArtProvider}
+if wx.Platform not in _PLATFORM_MAP:
+    raise ImportError("No ribbon art provider for %s" % wx.Platform)
+_BASE = _PLATFORM_MAP[wx.Platform]
+
+
+class RibbonDefaultArtProvider(_BASE):
+    """ Default art provider for the current platform. """
+    pass
@@ -5,6 +5,8 @@ import StringIO
 
 __version__ = '0.8'
 
+HASH_ALGORITHMS = ('MD5', 'SHA1', 'SHA256', 'SHA512')
+
 #GNTP/<version> <messagetype> <encryptionAlgorithmID>[:<ivValue>][ <keyHashAlgorithmID>:<keyHash>.<salt>]
 GNTP_INFO_LINE = re.compile(
 	'GNTP/(?P<version>\d+\.\d+) (?P<messagetype>REGISTER|NOTIFY|SUBSCRIBE|\-OK|\-ERROR)' +
@@ -95,31 +97,26 @@ class _GNTPBase(object):
 		:param string password: Null to clear password
 		:param string encryptAlgo: Supports MD5, SHA1, SHA256, SHA512
 		"""
-		hash = {
-			'MD5': hashlib.md5,
-			'SHA1': hashlib.sha1,
-			'SHA256': hashlib.sha256,
-			'SHA512': hashlib.sha512,
-		}
-
 		self.password = password
 		self.encryptAlgo = encryptAlgo.upper()
 		if not password:
 			self.info['encryptionAlgorithmID'] = None
 			self.info['keyHashAlgorithm'] = None
 			return
-		if not self.encryptAlgo in hash.keys():
+		if not self.encryptAlgo in HASH_ALGORITHMS:
 			raise UnsupportedError('INVALID HASH "%s"' % self.encryptAlgo)
 
-		hashfunction = hash.get(self.encryptAlgo)
+		# hashlib.new goes through OpenSSL, which picks up hardware
+		# SHA extensions when available
+		algo = self.encryptAlgo.lower()
 
 		password = password.encode('utf8')
 		seed = time.ctime()
-		salt = hashfunction(seed).hexdigest()
-		saltHash = hashfunction(seed).digest()
+		salt = hashlib.new(algo, seed).hexdigest()
+		saltHash = hashlib.new(algo, seed).digest()
 		keyBasis = password + saltHash
-		key = hashfunction(keyBasis).digest()
-		keyHash = hashfunction(key).hexdigest()
+		key = hashlib.new(algo, keyBasis).digest()
+		keyHash = hashlib.new(algo, key).hexdigest()
 
 		self.info['keyHashAlgorithmID'] = self.encryptAlgo
 		self.info['keyHash'] = keyHash.upper()
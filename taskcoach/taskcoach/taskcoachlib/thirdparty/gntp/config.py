@@ -21,6 +21,11 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
+def _config_path():
+	"""Path of the user config file; a function so tests can patch it"""
+	return os.path.expanduser('~/.gntp')
+
+
 def mini(description, applicationName='PythonMini', noteType="Message",
 			title="Mini Message", applicationIcon=None, hostname='localhost',
 			password=None, port=23053, sticky=False, priority=None,
@@ -79,7 +84,7 @@ class GrowlNotifier(gntp.notifier.GrowlNotifier):
 			'port': port,
 		})
 
-		config.read([os.path.expanduser('~/.gntp')])
+		config.read([_config_path()])
 
 		# If the file does not exist, then there will be no gntp section defined
 		# and the config.get() lines below will get confused. Since we are not
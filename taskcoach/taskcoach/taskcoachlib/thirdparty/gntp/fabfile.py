@@ -1,17 +1,15 @@
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-from future import standard_library
-standard_library.install_aliases()
-from builtins import *
+import pathlib
+import shutil
+
 from fabric.api import local
 
 
 def clean():
 	"Remove all generated files"
-	local("rm -rf build dist")
-	local("find . -name *.pyc -delete")
+	shutil.rmtree('build', ignore_errors=True)
+	shutil.rmtree('dist', ignore_errors=True)
+	for path in pathlib.Path('.').rglob('*.pyc'):
+		path.unlink()
 
 
 def test():
@@ -0,0 +1,66 @@
+"""Run the gntp test suite with ``python -m gntp.test``.
+
+Discovery results are cached on disk, keyed by the mtimes of the test
+files, so repeated runs on an unchanged tree skip the collection walk.
+"""
+import hashlib
+import os
+import pickle
+import sys
+import unittest
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_FILE = os.path.join(
+	os.path.expanduser('~/.cache'), 'gntp-tests.suite')
+
+
+def _tree_hash():
+	digest = hashlib.md5()
+	for name in sorted(os.listdir(TEST_DIR)):
+		if name.endswith('.py'):
+			path = os.path.join(TEST_DIR, name)
+			digest.update(('%s:%s' % (name, os.path.getmtime(path))).encode('utf-8'))
+	return digest.hexdigest()
+
+
+def load_suite():
+	loader = unittest.TestLoader()
+	tree_hash = _tree_hash()
+	try:
+		with open(CACHE_FILE, 'rb') as cache:
+			cached_hash, test_names = pickle.load(cache)
+		if cached_hash == tree_hash:
+			# discover() inserts TEST_DIR into sys.path before importing
+			# the test modules; loading from cached names needs the same.
+			if TEST_DIR not in sys.path:
+				sys.path.insert(0, TEST_DIR)
+			suite = loader.loadTestsFromNames(test_names)
+			if not loader.errors:
+				return suite
+			# The cached names no longer load (e.g. tests renamed with
+			# unchanged mtimes); rediscover with a clean loader.
+			loader = unittest.TestLoader()
+	except (IOError, OSError, pickle.PickleError, EOFError):
+		pass
+	suite = loader.discover(TEST_DIR)
+	test_names = [test.id() for test in _flatten(suite)]
+	try:
+		os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+		with open(CACHE_FILE, 'wb') as cache:
+			pickle.dump((tree_hash, test_names), cache)
+	except (IOError, OSError):
+		pass
+	return suite
+
+
+def _flatten(suite):
+	for test in suite:
+		if isinstance(test, unittest.TestSuite):
+			for subtest in _flatten(test):
+				yield subtest
+		else:
+			yield test
+
+
+if __name__ == '__main__':
+	unittest.TextTestRunner(verbosity=2).run(load_suite())
@@ -0,0 +1,68 @@
+"""Thread-pooled runner for the gntp test suite.
+
+The gntp tests are independent network round-trips, so wall time is
+dominated by socket latency rather than CPU. Running each TestCase
+class in its own worker thread overlaps those round-trips; the GIL is
+not a bottleneck for socket-bound work.
+"""
+import os
+import unittest
+from concurrent import futures
+
+MAX_WORKERS = 8
+
+
+def _suites_by_class(suite):
+	"""Group the discovered tests into one sub-suite per TestCase class.
+
+	Running whole sub-suites through TestSuite.run keeps unittest's
+	class-fixture machinery working (setUpClass/tearDownClass fire once
+	per class), and since GNTPTestCase creates its notifier per class,
+	each worker gets its own notifier and keep-alive socket - no state
+	is shared between threads.
+	"""
+	by_class = {}
+	for test in _flatten(suite):
+		by_class.setdefault(type(test), []).append(test)
+	return [unittest.TestSuite(tests) for tests in by_class.values()]
+
+
+def _run_suite(suite):
+	# Each worker runs against its own result; TestSuite.run's fixture
+	# bookkeeping on the result object is not thread-safe.
+	result = unittest.TestResult()
+	suite.run(result)
+	return result
+
+
+def run(max_workers=MAX_WORKERS):
+	"""Discover the suite and run one sub-suite per class over a thread pool"""
+	suite = unittest.TestLoader().discover(
+		os.path.dirname(os.path.abspath(__file__)), pattern='*test*.py')
+	result = unittest.TestResult()
+	with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+		for partial in pool.map(_run_suite, _suites_by_class(suite)):
+			result.testsRun += partial.testsRun
+			result.failures.extend(partial.failures)
+			result.errors.extend(partial.errors)
+			result.skipped.extend(partial.skipped)
+	return result
+
+
+def _flatten(suite):
+	for test in suite:
+		if isinstance(test, unittest.TestSuite):
+			for subtest in _flatten(test):
+				yield subtest
+		else:
+			yield test
+
+
+if __name__ == '__main__':
+	result = run()
+	print('Ran %d tests: %d failures, %d errors, %d skipped' % (
+		result.testsRun, len(result.failures), len(result.errors),
+		len(result.skipped)))
+	for test, traceback in result.failures + result.errors:
+		print(test)
+		print(traceback)
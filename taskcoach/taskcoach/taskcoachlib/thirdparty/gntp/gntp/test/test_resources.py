@@ -27,7 +27,7 @@ class ResourceTest(GNTPTestCase):
 			)
 		resource = notification.add_resource(ICON_DATA)
 		notification.add_header('Notification-Icon', resource)
-		self.assertIsTrue(self.growl._send('notify', notification))
+		self.assertTrue(self.growl._send('notify', notification))
 
 	def test_double_resource(self):
 		notification = gntp.GNTPNotice(
@@ -41,4 +41,4 @@ class ResourceTest(GNTPTestCase):
 		resource = notification.add_resource(ICON_DATA)
 		notification.add_header('Notification-Icon', resource)
 
-		self.assertIsTrue(self.growl._send('notify', notification))
+		self.assertTrue(self.growl._send('notify', notification))
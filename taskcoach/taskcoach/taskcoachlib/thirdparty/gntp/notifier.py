@@ -75,6 +75,9 @@ class GrowlNotifier(object):
 
 	passwordHash = 'MD5'
 	socketTimeout = 3
+	# Class-level default so subclasses that don't chain to __init__
+	# (such as gntp.config.GrowlNotifier) still get a clean slate
+	_sock = None
 
 	def __init__(self, applicationName='Python GNTP', notifications=[],
 			defaultNotifications=None, applicationIcon=None, hostname='localhost',
@@ -91,6 +94,7 @@ class GrowlNotifier(object):
 		self.password = password
 		self.hostname = hostname
 		self.port = int(port)
+		self._sock = None
 
 	def _checkIcon(self, data):
 		'''
@@ -208,6 +212,34 @@ class GrowlNotifier(object):
 	def subscribe_hook(self, packet):
 		pass
 
+	def _connect(self):
+		"""Return a connected socket, reusing the keep-alive one when possible"""
+		if self._sock is None:
+			sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+			sock.settimeout(self.socketTimeout)
+			sock.connect((self.hostname, self.port))
+			self._sock = sock
+		return self._sock
+
+	def close(self):
+		"""Close the keep-alive socket, if any"""
+		if self._sock is not None:
+			try:
+				self._sock.close()
+			finally:
+				self._sock = None
+
+	def _exchange(self, data):
+		"""Write a packet and read the response on the keep-alive socket"""
+		s = self._connect()
+		s.send(data)
+		recv_data = s.recv(1024)
+		while recv_data and not recv_data.endswith("\r\n\r\n"):
+			recv_data += s.recv(1024)
+		if not recv_data:
+			raise socket.error('Connection closed by peer')
+		return recv_data
+
 	def _send(self, messagetype, packet):
 		"""Send the GNTP Packet"""
 
@@ -216,15 +248,14 @@ class GrowlNotifier(object):
 
 		logger.debug('To : %s:%s <%s>\n%s', self.hostname, self.port, packet.__class__, data)
 
-		s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-		s.settimeout(self.socketTimeout)
-		s.connect((self.hostname, self.port))
-		s.send(data)
-		recv_data = s.recv(1024)
-		while not recv_data.endswith("\r\n\r\n"):
-			recv_data += s.recv(1024)
+		try:
+			recv_data = self._exchange(data)
+		except socket.error:
+			# The server may have dropped the keep-alive connection between
+			# notifications; reconnect and retry once.
+			self.close()
+			recv_data = self._exchange(data)
 		response = gntp.parse_gntp(recv_data)
-		s.close()
 
 		logger.debug('From : %s:%s <%s>\n%s', self.hostname, self.port, response.__class__, response)
 
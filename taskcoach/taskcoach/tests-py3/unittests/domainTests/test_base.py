@@ -22,6 +22,8 @@ import weakref
 
 import wx
 
+from pubsub import pub
+
 import tctest
 from taskcoachlib import patterns
 from taskcoachlib.domain import base, date
@@ -92,6 +94,35 @@ class SynchronizedObjectTest(tctest.TestCase):
         self.assertOneEventReceived(self.object,
                                     self.object.markNotDeletedEventType(), self.object.STATUS_NEW)
 
+    def testSetStatusBulkChangesEveryObject(self):
+        objects = [base.SynchronizedObject() for _ in range(3)]
+        base.SynchronizedObject.setStatusBulk(
+            objects, base.SynchronizedObject.STATUS_CHANGED)
+        for obj in objects:
+            self.assertEqual(base.SynchronizedObject.STATUS_CHANGED,
+                             obj.getStatus())
+
+    def testSetStatusBulkSendsOneAggregatedMessage(self):
+        messages = []
+
+        def onBulkStatus(sender, status, count):
+            messages.append((sender, status, count))
+
+        pub.subscribe(onBulkStatus,
+                      base.SynchronizedObject.bulkStatusChangedEventType())
+        objects = [base.SynchronizedObject() for _ in range(3)]
+        base.SynchronizedObject.setStatusBulk(
+            objects, base.SynchronizedObject.STATUS_DELETED)
+        self.assertEqual([(base.SynchronizedObject,
+                           base.SynchronizedObject.STATUS_DELETED, 3)],
+                         messages)
+
+    def testSetStatusBulkSendsNoPerObjectEvents(self):
+        self.registerObserver(self.object.markDeletedEventType())
+        base.SynchronizedObject.setStatusBulk(
+            [self.object], base.SynchronizedObject.STATUS_DELETED)
+        self.assertEqual([], self.events)
+
 
 class ObjectSubclass(base.Object):
     pass
@@ -16,27 +16,27 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from ... import tctest
+import tctest
 from taskcoachlib import patterns
 
 
-class Singleton(metaclass=patterns.Singleton):
-    pass
-
-
 class SingletonTest(tctest.TestCase):
-    def tearDown(self):
-        super().tearDown()
-        self.resetSingleton()
+    # Each test creates its own throwaway singleton class so there is no
+    # shared state between tests and no tearDown cleanup to serialize on.
 
-    def resetSingleton(self):
-        Singleton.deleteInstance()  # pylint: disable=E1101
+    def freshSingletonClass(self):
+        class Singleton(metaclass=patterns.Singleton):
+            pass
+
+        return Singleton
 
     def testCreation(self):
+        Singleton = self.freshSingletonClass()
         singleton = Singleton()
         self.assertTrue(isinstance(singleton, Singleton))
 
     def testCreateTwice(self):
+        Singleton = self.freshSingletonClass()
         single1 = Singleton()
         single2 = Singleton()
         self.assertTrue(single1 is single2)
@@ -66,38 +66,51 @@ class SingletonTest(tctest.TestCase):
         self.assertEqual(1, SingletonWithInit._count)  # pylint: disable=W0212
 
     def testDeleteInstance(self):
+        Singleton = self.freshSingletonClass()
         singleton1 = Singleton()
-        self.resetSingleton()
+        Singleton.deleteInstance()  # pylint: disable=E1101
         singleton2 = Singleton()
         self.assertFalse(singleton1 is singleton2)
 
     def testSingletonHasNoInstanceBeforeFirstCreation(self):
+        Singleton = self.freshSingletonClass()
         self.assertFalse(Singleton.hasInstance())  # pylint: disable=E1101
 
     def testSingletonHasInstanceAfterFirstCreation(self):
+        Singleton = self.freshSingletonClass()
         Singleton()
         self.assertTrue(Singleton.hasInstance())  # pylint: disable=E1101
 
     def testSingletonHasInstanceAfterSecondCreation(self):
+        Singleton = self.freshSingletonClass()
         Singleton()
         Singleton()
         self.assertTrue(Singleton.hasInstance())  # pylint: disable=E1101
 
     def testSingletonHasNoInstanceAfterDeletion(self):
+        Singleton = self.freshSingletonClass()
         Singleton()
-        self.resetSingleton()
+        Singleton.deleteInstance()  # pylint: disable=E1101
         self.assertFalse(Singleton.hasInstance())  # pylint: disable=E1101
 
 
 class SingletonSubclassTest(tctest.TestCase):
+    def freshSingletonClass(self):
+        class Singleton(metaclass=patterns.Singleton):
+            pass
+
+        return Singleton
+
     def testSubclassesAreSingletonsToo(self):
-        class Sub(Singleton):
+        class Sub(self.freshSingletonClass()):
             pass
         sub1 = Sub()
         sub2 = Sub()
         self.assertTrue(sub1 is sub2)
 
     def testDifferentSubclassesAreNotTheSameSingleton(self):
+        Singleton = self.freshSingletonClass()
+
         class Sub1(Singleton):
             pass
         sub1 = Sub1()
@@ -108,7 +121,7 @@ class SingletonSubclassTest(tctest.TestCase):
         self.assertFalse(sub1 is sub2)
 
     def testSubclassesCanHaveInit(self):
-        class Sub(Singleton):
+        class Sub(self.freshSingletonClass()):
             def __init__(self):
                 super().__init__()
                 self.a = 1
@@ -116,14 +129,14 @@ class SingletonSubclassTest(tctest.TestCase):
         self.assertEqual(1, sub.a)
 
     def testSubclassInitCanHaveArgs(self):
-        class Sub(Singleton):
+        class Sub(self.freshSingletonClass()):
             def __init__(self, arg):
                 super().__init__()
                 self.arg = arg
         self.assertEqual('Yo', Sub('Yo').arg)
 
     def testSubclassInitIsOnlyCalledOnce(self):
-        class Sub(Singleton):
+        class Sub(self.freshSingletonClass()):
             _count = 0
 
             def __init__(self):
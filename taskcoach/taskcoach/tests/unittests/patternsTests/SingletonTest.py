@@ -20,31 +20,29 @@ import test
 from ....taskcoachlib import patterns
 
 
-class Singleton(object):
-    __metaclass__ = patterns.Singleton
-
-
 class SingletonTest(test.TestCase):
-    def tearDown(self):
-        super(SingletonTest, self).tearDown()
-        self.resetSingleton()
+    # Each test creates its own throwaway singleton class so there is no
+    # shared state between tests and no tearDown cleanup to serialize on.
 
-    def resetSingleton(self):
-        Singleton.deleteInstance()  # pylint: disable=E1101
+    def freshSingletonClass(self):
+        class Singleton(object, metaclass=patterns.Singleton):
+            pass
+
+        return Singleton
 
     def testCreation(self):
+        Singleton = self.freshSingletonClass()
         singleton = Singleton()
         self.failUnless(isinstance(singleton, Singleton))
 
     def testCreateTwice(self):
+        Singleton = self.freshSingletonClass()
         single1 = Singleton()
         single2 = Singleton()
         self.failUnless(single1 is single2)
 
     def testSingletonsCanHaveInit(self):
-        class SingletonWithInit:
-            __metaclass__ = patterns.Singleton
-
+        class SingletonWithInit(object, metaclass=patterns.Singleton):
             def __init__(self):
                 self.a = 1
 
@@ -52,9 +50,7 @@ class SingletonTest(test.TestCase):
         self.assertEqual(1, single.a)
 
     def testSingletonInitCanHaveArgs(self):
-        class SingletonWithInit:
-            __metaclass__ = patterns.Singleton
-
+        class SingletonWithInit(object, metaclass=patterns.Singleton):
             def __init__(self, arg):
                 self.a = arg
 
@@ -62,9 +58,8 @@ class SingletonTest(test.TestCase):
         self.assertEqual('Yo', single.a)
 
     def testSingletonInitIsOnlyCalledOnce(self):
-        class SingletonWithInit:
+        class SingletonWithInit(object, metaclass=patterns.Singleton):
             _count = 0
-            __metaclass__ = patterns.Singleton
 
             def __init__(self):
                 SingletonWithInit._count += 1
@@ -74,32 +69,43 @@ class SingletonTest(test.TestCase):
         self.assertEqual(1, SingletonWithInit._count)  # pylint: disable=W0212
 
     def testDeleteInstance(self):
+        Singleton = self.freshSingletonClass()
         singleton1 = Singleton()
-        self.resetSingleton()
+        Singleton.deleteInstance()  # pylint: disable=E1101
         singleton2 = Singleton()
         self.failIf(singleton1 is singleton2)
 
     def testSingletonHasNoInstanceBeforeFirstCreation(self):
+        Singleton = self.freshSingletonClass()
         self.failIf(Singleton.hasInstance())  # pylint: disable=E1101
 
     def testSingletonHasInstanceAfterFirstCreation(self):
+        Singleton = self.freshSingletonClass()
         Singleton()
         self.failUnless(Singleton.hasInstance())  # pylint: disable=E1101
 
     def testSingletonHasInstanceAfterSecondCreation(self):
+        Singleton = self.freshSingletonClass()
         Singleton()
         Singleton()
         self.failUnless(Singleton.hasInstance())  # pylint: disable=E1101
 
     def testSingletonHasNoInstanceAfterDeletion(self):
+        Singleton = self.freshSingletonClass()
         Singleton()
-        self.resetSingleton()
+        Singleton.deleteInstance()  # pylint: disable=E1101
         self.failIf(Singleton.hasInstance())  # pylint: disable=E1101
 
 
 class SingletonSubclassTest(test.TestCase):
+    def freshSingletonClass(self):
+        class Singleton(object, metaclass=patterns.Singleton):
+            pass
+
+        return Singleton
+
     def testSubclassesAreSingletonsToo(self):
-        class Sub(Singleton):
+        class Sub(self.freshSingletonClass()):
             pass
 
         sub1 = Sub()
@@ -107,6 +113,8 @@ class SingletonSubclassTest(test.TestCase):
         self.failUnless(sub1 is sub2)
 
     def testDifferentSubclassesAreNotTheSameSingleton(self):
+        Singleton = self.freshSingletonClass()
+
         class Sub1(Singleton):
             pass
 
@@ -119,7 +127,7 @@ class SingletonSubclassTest(test.TestCase):
         self.failIf(sub1 is sub2)
 
     def testSubclassesCanHaveInit(self):
-        class Sub(Singleton):
+        class Sub(self.freshSingletonClass()):
             def __init__(self):
                 super(Sub, self).__init__()
                 self.a = 1
@@ -128,7 +136,7 @@ class SingletonSubclassTest(test.TestCase):
         self.assertEqual(1, sub.a)
 
     def testSubclassInitCanHaveArgs(self):
-        class Sub(Singleton):
+        class Sub(self.freshSingletonClass()):
             def __init__(self, arg):
                 super(Sub, self).__init__()
                 self.arg = arg
@@ -136,7 +144,7 @@ class SingletonSubclassTest(test.TestCase):
         self.assertEqual('Yo', Sub('Yo').arg)
 
     def testSubclassInitIsOnlyCalledOnce(self):
-        class Sub(Singleton):
+        class Sub(self.freshSingletonClass()):
             _count = 0
 
             def __init__(self):